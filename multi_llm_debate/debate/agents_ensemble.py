@@ -1,5 +1,6 @@
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from ..utils.config_manager import get_models
@@ -12,6 +13,8 @@ class AgentsEnsemble:
 
     This class manages multiple Agent instances and provides methods to interact with them
     collectively. It can be initialized automatically from configuration or built manually.
+    Concurrent responses run on a worker pool that is reused across prompts; release it
+    with close() or by using the ensemble as a context manager.
 
     Attributes:
         agents (List[Agent]): List of Agent instances in the ensemble.
@@ -43,6 +46,10 @@ class AgentsEnsemble:
         self.max_workers = max_workers
         self.job_delay = job_delay
         self.agents = []
+        # Created on first use and reused across rounds so worker threads
+        # aren't respawned per prompt
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         if config_list is not None:
             self._initialize_from_config_list(config_list)
@@ -92,6 +99,18 @@ class AgentsEnsemble:
         """
         self.agents.append(agent)
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool for concurrent responses, creating it if needed.
+
+        Returns:
+            ThreadPoolExecutor: The pool shared by all prompts to this ensemble.
+        """
+        # Debates running in parallel may share one ensemble
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
     def _get_response_concurrent(
         self, prompt: str, json_mode: bool = False
     ) -> List[Dict[str, Any]]:
@@ -102,7 +121,8 @@ class AgentsEnsemble:
             json_mode (bool, optional): Whether to expect JSON response. Defaults to False.
 
         Returns:
-            List[Dict[str, Any]]: List of responses from all agents.
+            List[Dict[str, Any]]: List of responses from all agents, in the same
+                order as the agents.
 
         Raises:
             LLMConnectionError: If any agent encounters a connection error.
@@ -110,22 +130,21 @@ class AgentsEnsemble:
         responses = []
         errors = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-
-            for agent in self.agents:
-                if self.job_delay > 0:
-                    time.sleep(self.job_delay)
-                futures.append(
-                    executor.submit(agent.respond, prompt, json_mode=json_mode)
-                )
+        executor = self._get_executor()
+        futures = []
+        for agent in self.agents:
+            if self.job_delay > 0:
+                time.sleep(self.job_delay)
+            futures.append(executor.submit(agent.respond, prompt, json_mode=json_mode))
 
-            for future in as_completed(futures):
-                try:
-                    response = future.result()
-                    responses.append(response)
-                except LLMConnectionError as e:
-                    errors.append(str(e))
+        # Collect in submission order so responses line up with the agents;
+        # the round is only done once the slowest agent has answered anyway
+        for future in futures:
+            try:
+                response = future.result()
+                responses.append(response)
+            except LLMConnectionError as e:
+                errors.append(str(e))
 
         if errors:
             raise LLMConnectionError(
@@ -189,6 +208,19 @@ class AgentsEnsemble:
                 return agent
         raise ValueError(f"Agent with ID {agent_id} not found")
 
+    def close(self) -> None:
+        """Shut down the worker threads used for concurrent responses."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AgentsEnsemble":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def __len__(self) -> int:
         return len(self.agents)
 
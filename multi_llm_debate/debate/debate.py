@@ -94,8 +94,13 @@ def check_convergence(responses: List[Dict]) -> bool:
         bool: True if all responses are the same, False otherwise.
     """
     try:
-        answers = [extract_bool_answer(response) for response in responses]
-        return len(set(answers)) == 1
+        if not responses:
+            return False
+        first_answer = extract_bool_answer(responses[0])
+        # Stop parsing as soon as one agent disagrees with the first
+        return all(
+            extract_bool_answer(response) == first_answer for response in responses[1:]
+        )
     except Exception as e:
         logger.error(f"Error checking convergence: {str(e)}", exc_info=True)
         raise
@@ -114,9 +119,9 @@ def main():
         round_n_fn=build_bool_q_round_n_prompt,
         prompt_params={"question": question, "passage": passage},
     )
-    agents_ensemble = AgentsEnsemble()
     output_dir = "data/test"
-    debate(3, prompt_builder, agents_ensemble, output_dir)
+    with AgentsEnsemble() as agents_ensemble:
+        debate(3, prompt_builder, agents_ensemble, output_dir)
 
 
 if __name__ == "__main__":
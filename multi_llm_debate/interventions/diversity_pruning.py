@@ -1,14 +1,50 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
-from .utils import compute_sentence_embedding, kullback_leibler_approximation_distance
+from .utils import compute_sentence_embeddings
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+def _select_diverse(embeddings: np.ndarray, selected_amount: int) -> List[int]:
+    """Greedily select the indices of the most mutually distant embeddings.
+
+    Starting from the first embedding, each step adds the candidate with the
+    largest total cosine distance (the KL approximation) to those already
+    selected. All pairwise distances come from one matrix product, and each
+    step updates the running totals with a single column.
+
+    Args:
+        embeddings: Array of shape (n, d) with one embedding per response.
+        selected_amount: The number of indices to select (k <= n).
+
+    Returns:
+        The selected indices, in selection order.
+    """
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    distances = 1.0 - normalized @ normalized.T
+
+    selected_indices = [0]
+    available = np.ones(len(embeddings), dtype=bool)
+    available[0] = False
+    total_distances = distances[:, 0].copy()
+
+    while len(selected_indices) < selected_amount:
+        # argmax keeps the first of tied candidates, like a strict > scan
+        next_index = int(np.argmax(np.where(available, total_distances, -np.inf)))
+        selected_indices.append(next_index)
+        available[next_index] = False
+        total_distances += distances[:, next_index]
+
+    return selected_indices
 
 
 def diversity_pruning(
     responses: List[str],
     selected_amount: int,
-    model: SentenceTransformer = None,
+    model: "SentenceTransformer" = None,
 ) -> List[str]:
     """Select a subset of responses that maximizes information entropy.
 
@@ -32,32 +68,10 @@ def diversity_pruning(
     if len(responses) <= selected_amount:
         return responses
 
-    # Compute embeddings for all responses
-    embeddings = [compute_sentence_embedding(model, response) for response in responses]
-
-    # Start with the first response
-    selected_indices = [0]
+    # Compute embeddings for all responses in one batch
+    embeddings = compute_sentence_embeddings(model, responses)
 
     # Iteratively select responses that maximize total KL divergence
-    while len(selected_indices) < selected_amount:
-        max_total_kl = float("-inf")
-        next_index = -1
-
-        # For each candidate response
-        for i in range(len(embeddings)):
-            if i in selected_indices:
-                continue
-
-            # Calculate total KL divergence if we add this response
-            total_kl = sum(
-                kullback_leibler_approximation_distance(embeddings[i], embeddings[j])
-                for j in selected_indices
-            )
-
-            if total_kl > max_total_kl:
-                max_total_kl = total_kl
-                next_index = i
-
-        selected_indices.append(next_index)
+    selected_indices = _select_diverse(embeddings, selected_amount)
 
     return [responses[i] for i in selected_indices]
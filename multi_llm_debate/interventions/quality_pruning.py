@@ -1,16 +1,18 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
-from .utils import compute_sentence_embedding, kullback_leibler_approximation_distance
+from .utils import compute_sentence_embeddings
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 
 def quality_pruning(
     responses: List[str],
     task: str,
     selected_amount: int,
-    model: SentenceTransformer = None,
+    model: "SentenceTransformer" = None,
 ) -> List[str]:
     """Select a subset of responses that are most similar to the task (maximizing quality).
 
@@ -35,17 +37,12 @@ def quality_pruning(
     if len(responses) <= selected_amount:
         return responses
 
-    # Compute the embedding for the task
-    task_embedding = compute_sentence_embedding(model, task)
-
-    # Compute the embeddings for all responses
-    embeddings = [compute_sentence_embedding(model, response) for response in responses]
+    # Compute normalized embeddings for the task and all responses in one batch
+    embeddings = compute_sentence_embeddings(model, [task, *responses])
+    task_embedding, response_embeddings = embeddings[0], embeddings[1:]
 
     # Compute the cosine distance (KL approximation) between the task and each response
-    distances = [
-        kullback_leibler_approximation_distance(task_embedding, embedding)
-        for embedding in embeddings
-    ]
+    distances = 1.0 - response_embeddings @ task_embedding
 
     # Select the indices of the k responses that are closest to the task (minimize distance)
     selected_indices = np.argsort(distances)[:selected_amount]
@@ -1,9 +1,16 @@
+from typing import TYPE_CHECKING, List
+
 import numpy as np
 from scipy.spatial.distance import cosine
-from sentence_transformers import SentenceTransformer
+
+# Only needed for annotations; importing it loads torch
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 
-def compute_sentence_embedding(model: SentenceTransformer, sentence: str) -> np.ndarray:
+def compute_sentence_embedding(
+    model: "SentenceTransformer", sentence: str
+) -> np.ndarray:
     """Compute the embedding vector for a given sentence using a SentenceTransformer model.
 
     Args:
@@ -16,6 +23,26 @@ def compute_sentence_embedding(model: SentenceTransformer, sentence: str) -> np.
     return model.encode([sentence])[0]
 
 
+def compute_sentence_embeddings(
+    model: "SentenceTransformer", sentences: List[str]
+) -> np.ndarray:
+    """Compute L2-normalized embeddings for several sentences in one batch.
+
+    Args:
+        model: A SentenceTransformer model instance used for encoding.
+        sentences: The input texts to be encoded.
+
+    Returns:
+        A C-contiguous float32 array of shape (len(sentences), d) whose rows
+        have unit length, so cosine similarities are plain dot products.
+    """
+    embeddings = np.asarray(model.encode(sentences), dtype=np.float32)
+    # Not in place, so an array owned by the model (or a cache) isn't modified
+    return np.ascontiguousarray(
+        embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    )
+
+
 def kullback_leibler_approximation_distance(
     embedding1: np.ndarray, embedding2: np.ndarray
 ) -> float:
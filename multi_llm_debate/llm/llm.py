@@ -3,6 +3,7 @@ import io
 import json
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Union
 
 import ollama
@@ -41,6 +42,22 @@ def encode_image(image_path: str) -> str:
     return encoded
 
 
+@lru_cache(maxsize=1)
+def get_api_client() -> OpenAI:
+    """Returns the OpenAI client shared by all API calls.
+
+    Reusing a single client keeps its HTTP connection pool alive across
+    requests instead of opening new connections for every call.
+
+    Returns:
+        OpenAI: The shared API client.
+    """
+    return OpenAI(
+        base_url=BASE_URL,
+        api_key=KEY,
+    )
+
+
 def call_model(
     model_name: str = "llama3.2:11b",
     provider: Literal["api", "ollama", "openai", "anthropic"] = "ollama",
@@ -324,11 +341,7 @@ def generate_with_api(
         str: The generated response from the API.
     """
     try:
-        # Initialize OpenAI client with timeout
-        client = OpenAI(
-            base_url=BASE_URL,
-            api_key=KEY,
-        )
+        client = get_api_client()
         messages = generate_api_messages(images=images, prompt=prompt)
 
         try:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 
 class PromptBuilder:
@@ -9,19 +9,51 @@ class PromptBuilder:
         round_zero_fn: Callable[..., str],
         round_n_fn: Callable[..., str],
         prompt_params: Dict[str, Any],
+        prepare_fn: Optional[Callable[..., Dict[str, Any]]] = None,
     ):
         """
         Args:
             round_zero_fn: Function to build initial round prompt
             round_n_fn: Function to build subsequent round prompts
             prompt_params: Dictionary of parameters needed by prompt functions
+            prepare_fn: Optional function called with prompt_params on the first
+                build. It returns extra parameters passed to every round, so work
+                shared by all rounds (e.g. a section built from the entry) is done
+                once per builder.
         """
         self.round_zero_fn = round_zero_fn
         self.round_n_fn = round_n_fn
         self.prompt_params = prompt_params
+        self.prepare_fn = prepare_fn
+        self._round_params: Optional[Dict[str, Any]] = None
+
+    def _get_round_params(self) -> Dict[str, Any]:
+        if self._round_params is None:
+            prepared = self.prepare_fn(**self.prompt_params) if self.prepare_fn else {}
+            self._round_params = {**self.prompt_params, **prepared}
+        return self._round_params
 
     def build_round_zero(self) -> str:
-        return self.round_zero_fn(**self.prompt_params)
+        return self.round_zero_fn(**self._get_round_params())
 
     def build_round_n(self, responses: List[str]) -> str:
-        return self.round_n_fn(**self.prompt_params, responses=responses)
+        return self.round_n_fn(**self._get_round_params(), responses=responses)
+
+    def with_params(self, **params: Any) -> "PromptBuilder":
+        """Return a builder with the same prompt functions and updated parameters.
+
+        The builder is copied rather than mutated so that entries debated
+        concurrently can share one base builder.
+
+        Args:
+            **params: Parameters to add to or override in prompt_params
+
+        Returns:
+            PromptBuilder: New builder; this builder is left unchanged
+        """
+        return PromptBuilder(
+            round_zero_fn=self.round_zero_fn,
+            round_n_fn=self.round_n_fn,
+            prompt_params={**self.prompt_params, **params},
+            prepare_fn=self.prepare_fn,
+        )
@@ -1,7 +1,22 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 NEW_LINE = "\n"
 
+BOOL_ROUND_ZERO_INTRO = (
+    "You will be given a true or false question which is based on a passage. "
+)
+
+BOOL_ROUND_N_INTRO = (
+    "Several other models have provided responses to a true or false question, "
+    "below are their responses: " + NEW_LINE
+)
+
+BOOL_ROUND_N_OUTRO = (
+    NEW_LINE
+    + "Consider these responses when answering the following true or false question."
+    + NEW_LINE
+)
+
 BOOL_JSON_FORMAT = """
 {
     "reasoning": "your reasoning based on the passage",
@@ -36,21 +51,54 @@ Final Answer: true/false
 """
 
 
-def build_bool_q_round_zero_prompt(
+def build_bool_q_answer_section(
     question: str, passage: str, use_cot: bool = True, json_mode: bool = False
 ) -> str:
-    prompt = "You will be given a true or false question which is based on a passage. "
     if json_mode:
-        prompt += "Answer in the following JSON format:" + NEW_LINE
-        prompt += BOOL_JSON_FORMAT_COT if use_cot else BOOL_JSON_FORMAT
+        intro = "Answer in the following JSON format:"
+        answer_format = BOOL_JSON_FORMAT_COT if use_cot else BOOL_JSON_FORMAT
     else:
-        prompt += "Answer in the following format:" + NEW_LINE
-        prompt += BOOL_NON_JSON_FORMAT_COT if use_cot else BOOL_NON_JSON_FORMAT
-    prompt += NEW_LINE
-    prompt += "Question: " + question + NEW_LINE
-    prompt += "Passage: " + passage
+        intro = "Answer in the following format:"
+        answer_format = BOOL_NON_JSON_FORMAT_COT if use_cot else BOOL_NON_JSON_FORMAT
+
+    return "".join(
+        [
+            intro,
+            NEW_LINE,
+            answer_format,
+            NEW_LINE,
+            "Question: ",
+            question,
+            NEW_LINE,
+            "Passage: ",
+            passage,
+        ]
+    )
 
-    return prompt
+
+def prepare_bool_q_prompt_params(
+    question: str, passage: str, use_cot: bool = True, json_mode: bool = False
+) -> Dict[str, str]:
+    # The answer section is the same in every round of an entry's debate
+    return {
+        "answer_section": build_bool_q_answer_section(
+            question, passage, use_cot, json_mode
+        )
+    }
+
+
+def build_bool_q_round_zero_prompt(
+    question: str,
+    passage: str,
+    use_cot: bool = True,
+    json_mode: bool = False,
+    answer_section: Optional[str] = None,
+) -> str:
+    if answer_section is None:
+        answer_section = build_bool_q_answer_section(
+            question, passage, use_cot, json_mode
+        )
+    return BOOL_ROUND_ZERO_INTRO + answer_section
 
 
 def build_bool_q_round_n_prompt(
@@ -59,28 +107,17 @@ def build_bool_q_round_n_prompt(
     responses: List[str | Dict],
     use_cot: bool = True,
     json_mode: bool = False,
+    answer_section: Optional[str] = None,
 ) -> str:
-    prompt = (
-        "Several other models have provided responses to a true or false question, below are their responses: "
-        + NEW_LINE
-    )
-
+    if answer_section is None:
+        answer_section = build_bool_q_answer_section(
+            question, passage, use_cot, json_mode
+        )
+    # Build the prompt in one join instead of one new string per piece
+    parts = [BOOL_ROUND_N_INTRO]
     for i, response in enumerate(responses, 1):
-        prompt += f"Model {i}: {response}" + NEW_LINE
-
-    prompt += NEW_LINE
-    prompt += (
-        "Consider these responses when answering the following true or false question."
-        + NEW_LINE
-    )
-    if json_mode:
-        prompt += "Answer in the following JSON format:" + NEW_LINE
-        prompt += BOOL_JSON_FORMAT_COT if use_cot else BOOL_JSON_FORMAT
-    else:
-        prompt += "Answer in the following format:" + NEW_LINE
-        prompt += BOOL_NON_JSON_FORMAT_COT if use_cot else BOOL_NON_JSON_FORMAT
-    prompt += NEW_LINE
-    prompt += "Question: " + question + NEW_LINE
-    prompt += "Passage: " + passage
+        parts.append(f"Model {i}: {response}{NEW_LINE}")
+    parts.append(BOOL_ROUND_N_OUTRO)
+    parts.append(answer_section)
 
-    return prompt
+    return "".join(parts)
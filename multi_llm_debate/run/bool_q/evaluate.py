@@ -4,8 +4,11 @@ from typing import Dict, List, Union
 import pandas as pd
 
 from ...llm.parsers import extract_bool_answer
+from ...utils.logging_config import setup_logging
 from ..shared.evaluate import EvaluationResults, evaluate_all
 
+logger = setup_logging(__name__)
+
 
 def evaluate_bool_q_responses(
     responses: List[Dict],
@@ -21,25 +24,24 @@ def evaluate_bool_q_responses(
         bool: True if all responses are the same and match the answer, False otherwise.
     """
     try:
-        raw_responses = [response["response"] for response in responses]
-        normalized_responses = [
-            extract_bool_answer(response) for response in raw_responses
-        ]
         answer_string = str(answer).lower()
 
-        # print(f"Normalized answer: {normalized_responses}")
-        # Filter out empty responses
-        valid_responses = [r for r in normalized_responses if r]
-        if not valid_responses:
-            # print("Warning: No valid responses found")
-            return False
-
-        # Check if all valid responses are the same
-        if len(set(valid_responses)) == 1:
-            return valid_responses[0] == answer_string
-        return False
+        first_answer = None
+        for response in responses:
+            normalized = extract_bool_answer(response["response"])
+            # Skip empty responses
+            if not normalized:
+                continue
+            if first_answer is None:
+                first_answer = normalized
+            elif normalized != first_answer:
+                # Stop parsing as soon as two valid responses disagree
+                return False
+
+        # All valid responses agree; check that they match the answer
+        return first_answer is not None and first_answer == answer_string
     except Exception as e:
-        print(f"Error evaluating responses: {e}")
+        logger.debug("Error evaluating responses: %s", e)
         return False
 
 
@@ -75,19 +77,12 @@ def main() -> EvaluationResults:
     Returns:
         EvaluationResults: Named tuple containing accuracies for all three methods.
     """
-    from ...utils.download_dataset import load_save_dataset_df
-    from .utils import process_bool_q_df
+    from .utils import load_bool_q_df
 
-    dataset_path = Path("datasets/boolq")
     response_base_dir = Path("data/bool_q/phi3")
 
     # Load and process the dataset
-    dataframe = load_save_dataset_df(
-        dataset_name="google/boolq",
-        dataset_path=dataset_path,
-        force_download=False,
-    )
-    processed_dataframe = process_bool_q_df(dataframe)
+    processed_dataframe = load_bool_q_df()
 
     # Run all bool evaluations and return results
     return evaluate_all_bool_q(response_base_dir, processed_dataframe)
@@ -1,22 +1,17 @@
-if __name__ == "__main__":
-    from pathlib import Path
+def main() -> None:
+    """Run the BoolQ debates and evaluations for every configured model setup."""
+    from ..shared.utils import Parser
+
+    # Parse arguments before the heavy imports so --help returns immediately
+    args = Parser(description="Run boolean question evaluation").parse_args()
 
-    from ...utils.download_dataset import load_save_dataset_df
     from ..shared.main import main as shared_main
-    from ..shared.utils import Parser
     from .evaluate import evaluate_all_bool_q
     from .run_debate import run_debate_bool_q
-    from .utils import process_bool_q_df
-
-    args = Parser(description="Run boolean question evaluation").parse_args()
+    from .utils import load_bool_q_df, process_bool_q_df
 
     # Load the dataset
-    dataset_path = Path("datasets/boolq")
-    dataframe = load_save_dataset_df(
-        dataset_name="google/boolq",
-        dataset_path=dataset_path,
-        force_download=False,
-    )
+    dataframe = load_bool_q_df()
 
     shared_main(
         dataframe=dataframe,
@@ -26,5 +21,10 @@ if __name__ == "__main__":
         task_name="bool_q",
         sample_size=args.sample_size,
         max_workers=args.max_workers,
+        max_concurrent_configs=args.max_concurrent_configs,
         config_path=args.config,
     )
+
+
+if __name__ == "__main__":
+    main()
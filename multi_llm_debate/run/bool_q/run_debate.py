@@ -1,37 +1,56 @@
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
 from ...llm.prompt_builder import PromptBuilder
-from ...llm.prompts import build_bool_q_round_n_prompt, build_bool_q_round_zero_prompt
+from ...llm.prompts import (
+    build_bool_q_round_n_prompt,
+    build_bool_q_round_zero_prompt,
+    prepare_bool_q_prompt_params,
+)
 from ...utils.logging_config import setup_logging
 from ...utils.model_config import ModelConfig
 from ..shared.run_debate import run_debate
+from ..shared.utils import resolve_max_workers
 
 logger = setup_logging(__name__)
 
+# Default output directory, overridable with the MLD_BOOLQ_DIR environment variable
+DEFAULT_BOOLQ_DIR = Path(os.environ.get("MLD_BOOLQ_DIR", "data/bool_q"))
+
 
 def run_debate_bool_q(
     dataframe: pd.DataFrame,
     max_rounds: int = 10,
-    base_dir: Path = Path("data") / "bool_q",
+    base_dir: Optional[Path] = None,
     use_cot: bool = True,
     model_configs: Optional[List[ModelConfig]] = None,
     overwrite: bool = False,
-    max_workers: Optional[int] = 4,
+    max_workers: Optional[int] = None,
+    max_concurrent_entries: int = 4,
+    sort_by_length: bool = True,
+    show_progress: bool = True,
 ) -> Dict[str, Any]:
     """Run the Boolean Question task on a DataFrame.
 
     Args:
         dataframe: Pandas DataFrame containing question, answer, passage and id
         max_rounds: Maximum number of debate rounds
-        base_dir: Base directory for output files
+        base_dir: Base directory for output files. Defaults to DEFAULT_BOOLQ_DIR
         use_cot: Whether to use chain-of-thought prompting (default: True)
         model_configs: Optional list of model configurations. If None,
                     default configs will be used.
         overwrite: Whether to overwrite existing debate results (default: False)
-        max_workers: Maximum number of concurrent workers (default: 4)
+        max_workers: Maximum number of concurrent agent calls per debate. If None,
+            resolved with resolve_max_workers (MLD_MAX_WORKERS or CPU-based)
+        max_concurrent_entries: Maximum number of entries debated concurrently
+            (default: 4)
+        sort_by_length: Whether to dispatch entries longest passage first, which
+            keeps long debates from straggling and groups similar lengths for
+            batching backends. Disable to keep the DataFrame order (default: True)
+        show_progress: Whether to draw a progress bar (default: True)
 
     Returns:
         Dict containing summary of execution including failed entries
@@ -39,16 +58,27 @@ def run_debate_bool_q(
     Raises:
         ValueError: If DataFrame format is invalid
     """
+    if base_dir is None:
+        base_dir = DEFAULT_BOOLQ_DIR
+
     # Initialize prompt builder with bool_q specific prompts
     prompt_builder = PromptBuilder(
         round_zero_fn=build_bool_q_round_zero_prompt,
         round_n_fn=build_bool_q_round_n_prompt,
         prompt_params={},  # Will be updated per entry
+        # Build each entry's answer section once for all of its rounds
+        prepare_fn=prepare_bool_q_prompt_params,
     )
 
     # Required columns for bool_q task
     required_columns = ["question", "answer", "passage", "id"]
 
+    # Dispatch the longest passages first so they don't straggle at the end
+    if sort_by_length and "passage" in dataframe.columns:
+        dataframe = dataframe.sort_values(
+            "passage", key=lambda s: s.str.len(), ascending=False, kind="stable"
+        )
+
     return run_debate(
         dataframe=dataframe,
         prompt_builder=prompt_builder,
@@ -58,5 +88,7 @@ def run_debate_bool_q(
         use_cot=use_cot,
         model_configs=model_configs,
         overwrite=overwrite,
-        max_workers=max_workers,
+        max_workers=resolve_max_workers(max_workers),
+        max_concurrent_entries=max_concurrent_entries,
+        show_progress=show_progress,
     )
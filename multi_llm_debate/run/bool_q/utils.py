@@ -1,3 +1,6 @@
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 
 
@@ -10,11 +13,41 @@ def process_bool_q_df(dataframe: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Processed DataFrame with all required columns
     """
-    # Create a copy to avoid modifying the original
-    processed_df = dataframe.copy()
+    # Shallow copy: adding the id column must not touch the original, but the
+    # question and passage columns can share their data with it
+    processed_df = dataframe.copy(deep=False)
 
     # Generate ID from index if 'id' column doesn't exist
     if "id" not in processed_df.columns:
         processed_df["id"] = processed_df.index + 1
 
     return processed_df
+
+
+def load_bool_q_df(
+    dataset_name: str = "google/boolq",
+    dataset_path: str | Path = "datasets/boolq",
+) -> pd.DataFrame:
+    """Load and process the BoolQ dataset once per process.
+
+    Args:
+        dataset_name: Name of the dataset on Hugging Face Hub
+        dataset_path: Local path where the dataset is saved
+
+    Returns:
+        pd.DataFrame: Processed BoolQ DataFrame shared by all callers
+    """
+    # Normalize the path so equivalent str and Path arguments share a cache entry
+    return _load_bool_q_df(dataset_name, str(Path(dataset_path)))
+
+
+@lru_cache(maxsize=4)
+def _load_bool_q_df(dataset_name: str, dataset_path: str) -> pd.DataFrame:
+    from ...utils.download_dataset import load_save_dataset_df
+
+    dataframe = load_save_dataset_df(
+        dataset_name=dataset_name,
+        dataset_path=Path(dataset_path),
+        force_download=False,
+    )
+    return process_bool_q_df(dataframe)
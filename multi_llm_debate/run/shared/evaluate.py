@@ -1,10 +1,19 @@
 import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, List, NamedTuple, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import pandas as pd
 
-from .utils import get_latest_round_file
+from .utils import get_latest_round_file, list_response_dirs
+
+# orjson is optional; it parses the per-entry response files several times faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Add type alias for the evaluation function
 EvaluationFunc = Callable[[List[Dict], Union[str, bool]], bool]
@@ -12,6 +21,9 @@ EvaluationFunc = Callable[[List[Dict], Union[str, bool]], bool]
 # Add type alias for extract functions
 ExtractFunc = Callable[[str], Optional[str]]
 
+# Add type alias for per-entry judge functions (None means skip the entry)
+JudgeFunc = Callable[[List[Dict], Union[str, bool]], Optional[bool]]
+
 
 class EvaluationResults(NamedTuple):
     """Container for evaluation results from all methods."""
@@ -21,10 +33,168 @@ class EvaluationResults(NamedTuple):
     ensemble_accuracy: float
 
 
+def build_response_paths(
+    response_base_dir: Path,
+    dataframe: pd.DataFrame,
+    file_name: Optional[str] = None,
+) -> List[Optional[str]]:
+    """Build the response path of every entry in a single vectorized pass.
+
+    The response directory is scanned once so that entries without results
+    can be skipped without touching the filesystem again.
+
+    Args:
+        response_base_dir: Directory containing response files.
+        dataframe: Pandas DataFrame containing an id column.
+        file_name: Optional file name to append to each entry directory.
+
+    Returns:
+        List[Optional[str]]: Response directory (or file) path for each row, or
+            None if the entry has no response directory.
+    """
+    ids = dataframe["id"].astype(str)
+    paths = str(response_base_dir) + os.sep + ids
+    if file_name is not None:
+        paths = paths + os.sep + file_name
+    paths = paths.astype(object).where(
+        ids.isin(list_response_dirs(response_base_dir)), None
+    )
+    return paths.tolist()
+
+
+def load_responses(response_file: str | Path) -> List[Dict]:
+    """Load the agent responses saved in a debate round file.
+
+    Args:
+        response_file: Path to the debate round JSON file.
+
+    Returns:
+        List[Dict]: Responses stored in the file.
+    """
+    with open(response_file, "rb") as f:
+        return json_loads(f.read())
+
+
+def count_correct_multi(
+    response_paths: List[Optional[str]],
+    dataframe: pd.DataFrame,
+    judge_funcs: List[JudgeFunc],
+    resolve_func: Optional[Callable[[str], str | Path]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """Count correct and valid entries for several judges in one pass.
+
+    Each response file is loaded once and passed to every judge. Entries whose
+    path is None or whose file is missing, unreadable or empty are skipped by
+    all judges, and the number skipped for each reason is printed. An entry a
+    judge cannot judge is skipped for that judge only. Files are loaded and
+    judged concurrently since the work is I/O-bound.
+
+    Args:
+        response_paths: Response path for each row of the DataFrame, or None
+            for rows without responses.
+        dataframe: Pandas DataFrame containing an answer column.
+        judge_funcs: Functions that take (responses, answer) and return whether
+            the entry is correct, or None if it should not be counted.
+        resolve_func: Optional function mapping a response path to the file
+            that should be loaded.
+        max_workers: Maximum number of threads loading files. Defaults to the
+            ThreadPoolExecutor default.
+
+    Returns:
+        List[Tuple[int, int]]: (number of correct entries, number of valid
+            entries) for each judge, in the order of judge_funcs.
+    """
+    skipped = [None] * len(judge_funcs)
+
+    def judge_entry(
+        response_path: Optional[str], answer: Union[str, bool]
+    ) -> Tuple[str, List[Optional[bool]]]:
+        if response_path is None:
+            return "missing", skipped
+
+        try:
+            if resolve_func is not None:
+                response_path = resolve_func(response_path)
+            responses = load_responses(response_path)
+        except (OSError, ValueError):
+            # No round file yet, or a file that isn't valid JSON
+            return "unreadable", skipped
+
+        # Skip if no valid responses
+        if not responses:
+            return "empty", skipped
+
+        results = []
+        for judge_func in judge_funcs:
+            try:
+                results.append(judge_func(responses, answer))
+            except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+                # Malformed responses can't be judged
+                results.append(None)
+        return "ok", results
+
+    answers = dataframe["answer"].to_numpy().tolist()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        entry_outcomes = list(executor.map(judge_entry, response_paths, answers))
+
+    skip_counts = Counter(status for status, _ in entry_outcomes if status != "ok")
+    if skip_counts:
+        print(
+            f"\nSkipped entries: {skip_counts['missing']} without results, "
+            f"{skip_counts['unreadable']} unreadable, {skip_counts['empty']} empty"
+        )
+
+    # None marks entries that were skipped
+    counts = []
+    for judge_index in range(len(judge_funcs)):
+        results = [entry_results[judge_index] for _, entry_results in entry_outcomes]
+        valid_count = sum(result is not None for result in results)
+        correct_count = sum(bool(result) for result in results if result is not None)
+        counts.append((correct_count, valid_count))
+
+    return counts
+
+
+def count_correct(
+    response_paths: List[Optional[str]],
+    dataframe: pd.DataFrame,
+    judge_func: JudgeFunc,
+    resolve_func: Optional[Callable[[str], str | Path]] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Count correct and valid entries over a list of response files.
+
+    Entries whose file is missing, empty or cannot be judged are skipped.
+
+    Args:
+        response_paths: Response path for each row of the DataFrame, or None
+            for rows without responses.
+        dataframe: Pandas DataFrame containing an answer column.
+        judge_func: Function that takes (responses, answer) and returns whether
+            the entry is correct, or None if it should not be counted.
+        resolve_func: Optional function mapping a response path to the file
+            that should be loaded.
+        max_workers: Maximum number of threads loading files.
+
+    Returns:
+        Tuple[int, int]: (number of correct entries, number of valid entries)
+    """
+    return count_correct_multi(
+        response_paths,
+        dataframe,
+        [judge_func],
+        resolve_func=resolve_func,
+        max_workers=max_workers,
+    )[0]
+
+
 def evaluate_debate_df(
     response_base_dir: Path,
     dataframe: pd.DataFrame,
     evaluation_func: Optional[EvaluationFunc] = None,
+    max_workers: Optional[int] = None,
 ) -> float:
     """Evaluate the Boolean Question task on a DataFrame.
 
@@ -33,6 +203,7 @@ def evaluate_debate_df(
         dataframe: Pandas DataFrame containing question, answer, passage and id.
         evaluation_func: Function that takes (responses, answer) and returns bool.
             Must accept List[Dict] as responses and str/bool as answer.
+        max_workers: Maximum number of threads loading response files.
 
     Returns:
         float: Accuracy score (number of correct answers / total valid responses)
@@ -40,40 +211,59 @@ def evaluate_debate_df(
     if evaluation_func is None:
         raise ValueError("evaluation_func must be provided")
 
-    correct_count = 0
-    valid_count = 0
+    # Evaluate the responses of the final debate round
+    correct_count, valid_count = count_correct(
+        build_response_paths(response_base_dir, dataframe),
+        dataframe,
+        judge_func=evaluation_func,
+        resolve_func=get_latest_round_file,
+        max_workers=max_workers,
+    )
 
-    for _, entry in dataframe.iterrows():
-        try:
-            answer = entry["answer"]
-            id_ = str(entry["id"])
+    # Calculate and output accuracy using valid responses
+    accuracy = correct_count / valid_count if valid_count > 0 else 0
+    print(f"\nOverall Accuracy: {accuracy:.2%}")
+    print(f"Valid responses: {valid_count}/{len(dataframe)}")
+
+    return accuracy
+
+
+def make_single_llm_judge(evaluation_func: EvaluationFunc) -> JudgeFunc:
+    """Build a judge that only considers the first agent's response.
+
+    Args:
+        evaluation_func: Function that takes (responses, answer) and returns bool.
 
-            # Load responses from the corresponding file
-            responses_dir = response_base_dir / id_
+    Returns:
+        JudgeFunc: Judge scoring the first response of a round.
+    """
 
-            # Get the final response file
-            final_response_file = get_latest_round_file(responses_dir)
+    def judge_first_response(
+        responses: List[Dict], answer: Union[str, bool]
+    ) -> Optional[bool]:
+        # Only use the first response, wrapped in a list for consistent interface
+        return evaluation_func([responses[0]], answer)
 
-            with open(final_response_file, "r") as f:
-                responses = json.load(f)
+    return judge_first_response
 
-            # Skip if no valid responses
-            if not responses:
-                continue
 
-            # Evaluate the responses
-            is_correct = evaluation_func(responses, answer)
-            valid_count += 1
-            if is_correct:
-                correct_count += 1
+def report_single_llm_accuracy(
+    correct_count: int, valid_count: int, total_count: int
+) -> float:
+    """Print and return the single LLM accuracy.
 
-        except Exception:
-            continue
+    Args:
+        correct_count: Number of correct entries.
+        valid_count: Number of entries that could be judged.
+        total_count: Number of entries in the DataFrame.
 
+    Returns:
+        float: Accuracy over the valid entries.
+    """
     # Calculate and output accuracy using valid responses
     accuracy = correct_count / valid_count if valid_count > 0 else 0
-    print(f"\nOverall Accuracy: {accuracy:.2%}")
-    print(f"Valid responses: {valid_count}/{len(dataframe)}")
+    print(f"\nSingle LLM Accuracy: {accuracy:.2%}")
+    print(f"Valid single LLM responses: {valid_count}/{total_count}")
 
     return accuracy
 
@@ -82,6 +272,7 @@ def evaluate_single_llm_df(
     response_base_dir: Path,
     dataframe: pd.DataFrame,
     evaluation_func: Optional[EvaluationFunc] = None,
+    max_workers: Optional[int] = None,
 ) -> float:
     """Evaluate the Boolean Question task using first answer as single LLM response.
 
@@ -90,6 +281,7 @@ def evaluate_single_llm_df(
         dataframe: Pandas DataFrame containing question, answer, passage and id.
         evaluation_func: Function that takes (responses, answer) and returns bool.
             Must accept List[Dict] as responses and str/bool as answer.
+        max_workers: Maximum number of threads loading response files.
 
     Returns:
         float: Accuracy score using first answer as single LLM response.
@@ -97,42 +289,14 @@ def evaluate_single_llm_df(
     if evaluation_func is None:
         raise ValueError("evaluation_func must be provided")
 
-    correct_count = 0
-    valid_count = 0
-
-    for _, entry in dataframe.iterrows():
-        try:
-            answer = entry["answer"]
-            id_ = str(entry["id"])
-
-            # Load responses from the first debate round file
-            responses_dir = response_base_dir / id_
-            first_response_file = responses_dir / "debate_round_0.json"
-
-            with open(first_response_file, "r") as f:
-                responses = json.load(f)
-
-            # Skip if no valid responses
-            if not responses:
-                continue
-
-            # Only use the first response
-            first_response = responses[0]
-            # Create a list with single response for consistent interface
-            is_correct = evaluation_func([first_response], answer)
-            valid_count += 1
-            if is_correct:
-                correct_count += 1
-
-        except Exception:
-            continue
-
-    # Calculate and output accuracy using valid responses
-    accuracy = correct_count / valid_count if valid_count > 0 else 0
-    print(f"\nSingle LLM Accuracy: {accuracy:.2%}")
-    print(f"Valid single LLM responses: {valid_count}/{len(dataframe)}")
+    correct_count, valid_count = count_correct(
+        build_response_paths(response_base_dir, dataframe, "debate_round_0.json"),
+        dataframe,
+        judge_func=make_single_llm_judge(evaluation_func),
+        max_workers=max_workers,
+    )
 
-    return accuracy
+    return report_single_llm_accuracy(correct_count, valid_count, len(dataframe))
 
 
 def get_majority_vote(
@@ -148,34 +312,77 @@ def get_majority_vote(
     Returns:
         str or None: The majority response or None if no valid majority.
     """
-    # Get all responses and their normalized answers
-    raw_responses = [response["response"] for response in responses]
-    normalized_responses = [extract_func(response) for response in raw_responses]
-    valid_responses = [r for r in normalized_responses if r]
+    # Count the normalized answers, skipping responses that couldn't be parsed
+    counts = Counter(
+        filter(None, (extract_func(response["response"]) for response in responses))
+    )
 
-    if not valid_responses:
+    if not counts:
         return None
 
-    # Count occurrences of each response
-    response_counts: Dict[str, int] = {}
-    for response in valid_responses:
-        response_counts[response] = response_counts.get(response, 0) + 1
-
     # Get majority vote (most common response)
-    majority_response = max(response_counts.items(), key=lambda x: x[1])[0]
+    majority_response, majority_count = counts.most_common(1)[0]
 
     # Check if it's a true majority (more than half)
-    total_votes = sum(response_counts.values())
-    if response_counts[majority_response] > total_votes / 2:
+    if majority_count * 2 > counts.total():
         return majority_response
     return None
 
 
+def make_majority_vote_judge(
+    extract_func: ExtractFunc, evaluation_func: EvaluationFunc
+) -> JudgeFunc:
+    """Build a judge that scores the majority vote of a round.
+
+    Args:
+        extract_func: Function to extract and normalize response strings.
+        evaluation_func: Function to evaluate if response matches answer.
+
+    Returns:
+        JudgeFunc: Judge that skips entries without a clear majority.
+    """
+
+    def judge_majority_vote(
+        responses: List[Dict], answer: Union[str, bool]
+    ) -> Optional[bool]:
+        # Skip entries without a clear majority
+        majority_response = get_majority_vote(responses, extract_func)
+        if majority_response is None:
+            return None
+
+        # Compare with correct answer
+        return evaluation_func([{"response": majority_response}], answer)
+
+    return judge_majority_vote
+
+
+def report_ensemble_accuracy(
+    correct_count: int, valid_count: int, total_count: int
+) -> float:
+    """Print and return the first round majority vote accuracy.
+
+    Args:
+        correct_count: Number of correct entries.
+        valid_count: Number of entries with a clear majority.
+        total_count: Number of entries in the DataFrame.
+
+    Returns:
+        float: Accuracy over the valid entries.
+    """
+    # Calculate and output accuracy using valid responses
+    accuracy = correct_count / valid_count if valid_count > 0 else 0
+    print(f"\nEnsemble Accuracy (First Round Majority): {accuracy:.2%}")
+    print(f"Valid ensemble responses: {valid_count}/{total_count}")
+
+    return accuracy
+
+
 def evaluate_ensemble_df(
     response_base_dir: Path,
     dataframe: pd.DataFrame,
     extract_func: ExtractFunc,
     evaluation_func: EvaluationFunc,
+    max_workers: Optional[int] = None,
 ) -> float:
     """Evaluate using majority vote from first round responses.
 
@@ -184,49 +391,57 @@ def evaluate_ensemble_df(
         dataframe: Pandas DataFrame containing question, answer, passage and id.
         extract_func: Function to extract and normalize response strings.
         evaluation_func: Function to evaluate if response matches answer.
+        max_workers: Maximum number of threads loading response files.
 
     Returns:
         float: Accuracy score using majority vote from first round responses.
     """
-    correct_count = 0
-    valid_count = 0
-
-    for _, entry in dataframe.iterrows():
-        try:
-            answer = entry["answer"]
-            id_ = str(entry["id"])
+    correct_count, valid_count = count_correct(
+        build_response_paths(response_base_dir, dataframe, "debate_round_0.json"),
+        dataframe,
+        judge_func=make_majority_vote_judge(extract_func, evaluation_func),
+        max_workers=max_workers,
+    )
 
-            # Load responses from the first debate round file
-            responses_dir = response_base_dir / id_
-            first_response_file = responses_dir / "debate_round_0.json"
+    return report_ensemble_accuracy(correct_count, valid_count, len(dataframe))
 
-            with open(first_response_file, "r") as f:
-                responses = json.load(f)
 
-            # Skip if no valid responses
-            if not responses:
-                continue
+def evaluate_single_llm_and_ensemble_df(
+    response_base_dir: Path,
+    dataframe: pd.DataFrame,
+    extract_func: ExtractFunc,
+    evaluation_func: EvaluationFunc,
+    max_workers: Optional[int] = None,
+) -> Tuple[float, float]:
+    """Evaluate single LLM and ensemble accuracy in one pass over round zero.
 
-            # Get majority vote
-            majority_response = get_majority_vote(responses, extract_func)
-            if majority_response is None:
-                continue
+    Both methods only read debate_round_0.json, so each file is loaded once and
+    scored by both judges.
 
-            # Compare with correct answer
-            is_correct = evaluation_func([{"response": majority_response}], answer)
-            valid_count += 1
-            if is_correct:
-                correct_count += 1
+    Args:
+        response_base_dir: Directory containing response files.
+        dataframe: Pandas DataFrame containing question, answer, passage and id.
+        extract_func: Function to extract and normalize response strings.
+        evaluation_func: Function to evaluate if response matches answer.
+        max_workers: Maximum number of threads loading response files.
 
-        except Exception:
-            continue
+    Returns:
+        Tuple[float, float]: (single LLM accuracy, ensemble accuracy)
+    """
+    single_counts, ensemble_counts = count_correct_multi(
+        build_response_paths(response_base_dir, dataframe, "debate_round_0.json"),
+        dataframe,
+        judge_funcs=[
+            make_single_llm_judge(evaluation_func),
+            make_majority_vote_judge(extract_func, evaluation_func),
+        ],
+        max_workers=max_workers,
+    )
 
-    # Calculate and output accuracy using valid responses
-    accuracy = correct_count / valid_count if valid_count > 0 else 0
-    print(f"\nEnsemble Accuracy (First Round Majority): {accuracy:.2%}")
-    print(f"Valid ensemble responses: {valid_count}/{len(dataframe)}")
+    single_acc = report_single_llm_accuracy(*single_counts, len(dataframe))
+    ensemble_acc = report_ensemble_accuracy(*ensemble_counts, len(dataframe))
 
-    return accuracy
+    return single_acc, ensemble_acc
 
 
 def evaluate_all(
@@ -256,18 +471,21 @@ def evaluate_all(
     # Only run single LLM evaluation for single model type
     single_acc = 0.0
     if not multiple_models:
-        print("\nRunning single LLM evaluation...")
-        single_acc = evaluate_single_llm_df(
-            response_base_dir, dataframe, evaluation_func=evaluation_func
+        print("\nRunning single LLM and ensemble evaluation...")
+        single_acc, ensemble_acc = evaluate_single_llm_and_ensemble_df(
+            response_base_dir,
+            dataframe,
+            extract_func=extract_func,
+            evaluation_func=evaluation_func,
+        )
+    else:
+        print("\nRunning ensemble evaluation...")
+        ensemble_acc = evaluate_ensemble_df(
+            response_base_dir,
+            dataframe,
+            extract_func=extract_func,
+            evaluation_func=evaluation_func,
         )
-
-    print("\nRunning ensemble evaluation...")
-    ensemble_acc = evaluate_ensemble_df(
-        response_base_dir,
-        dataframe,
-        extract_func=extract_func,
-        evaluation_func=evaluation_func,
-    )
 
     print("\nSummary of all evaluation methods:")
     print(f"Debate accuracy:     {debate_acc:.2%}")
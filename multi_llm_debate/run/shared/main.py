@@ -1,9 +1,12 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 import pandas as pd
 
-from .run import run
+from .run import append_results_csv, run
+from .utils import resolve_max_concurrent_configs
 
 
 def main(
@@ -15,6 +18,8 @@ def main(
     sample_size: Optional[int] = None,
     max_workers: Optional[int] = 4,
     config_path: Optional[Path] = None,
+    random_seed: int = 42,
+    max_concurrent_configs: Optional[int] = None,
 ) -> None:
     """Run debate evaluation with configured models.
 
@@ -27,30 +32,75 @@ def main(
         sample_size: Optional number of samples to process
         max_workers: Maximum number of concurrent workers
         config_path: Path to JSON config file
+        random_seed: Random seed for sampling
+        max_concurrent_configs: Maximum number of model configurations to run
+            concurrently. If None, resolved with resolve_max_concurrent_configs
+            (MLD_MAX_CONCURRENT_CONFIGS, or 1 if it is not set).
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        ValueError: If max_concurrent_configs is not a positive integer
     """
-    import json
+    # Use provided config path or default to config.json in task directory
+    if config_path is None:
+        config_path = Path(f"multi_llm_debate/run/{task_name}/config.json")
+
+    try:
+        config_bytes = Path(config_path).read_bytes()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found at {config_path}") from e
+    model_configs_list = json.loads(config_bytes)
 
+    # Process and sample the dataset once for all configurations
+    processed_df = process_df_fn(dataframe)
+    if sample_size:
+        processed_df = processed_df.sample(sample_size, random_state=random_seed)
+
+    # Don't run more configurations at once than the backends can serve
+    max_concurrent_configs = resolve_max_concurrent_configs(max_concurrent_configs)
+    config_workers = max(1, min(len(model_configs_list), max_concurrent_configs))
+
+    # Process all configurations, then save every results row in one write
+    report_path = Path(f"data/{task_name}")
+    report_path.mkdir(parents=True, exist_ok=True)
+    csv_path = report_path / "results.csv"
+    results_rows = []
+    errors = []
     try:
-        # Use provided config path or default to config.json in task directory
-        if config_path is None:
-            config_path = Path(f"multi_llm_debate/run/{task_name}/config.json")
-
-        with open(config_path) as f:
-            model_configs_list = json.load(f)
-
-        # Process all configurations
-        processed_df = process_df_fn(dataframe)
-        for model_configs in model_configs_list:
-            run(
-                dataframe=processed_df,
-                run_debate_fn=run_debate_fn,
-                evaluate_fn=evaluate_fn,
-                task_name=task_name,
-                sample_size=sample_size,
-                report_path=Path(f"data/{task_name}"),
-                model_configs=model_configs,
-                max_workers=max_workers,
-            )
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Configuration file not found at {config_path}")
+        with ThreadPoolExecutor(max_workers=config_workers) as executor:
+            futures = [
+                executor.submit(
+                    run,
+                    dataframe=processed_df,
+                    run_debate_fn=run_debate_fn,
+                    evaluate_fn=evaluate_fn,
+                    task_name=task_name,
+                    report_path=report_path,
+                    model_configs=model_configs,
+                    max_workers=max_workers,
+                    save_to_csv=False,
+                    # Concurrent configurations would overwrite each other's bars
+                    show_progress=config_workers == 1,
+                )
+                for model_configs in model_configs_list
+            ]
+            try:
+                # Wait in submission order so rows follow the config file
+                for future in futures:
+                    # A failed configuration must not discard the others' rows
+                    try:
+                        results_rows.append(future.result())
+                    except Exception as e:
+                        errors.append(e)
+            except BaseException:
+                # On Ctrl-C, don't start the configurations still queued
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        # Save the finished configurations even if others failed
+        if results_rows:
+            append_results_csv(csv_path, results_rows)
+            print(f"\nResults saved to {csv_path}")
+
+    if errors:
+        raise errors[0]
@@ -1,4 +1,5 @@
 import csv
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -9,6 +10,35 @@ from ...utils.model_config import ModelConfig
 from .evaluate import EvaluationResults
 from .utils import format_time, model_configs_to_string
 
+RESULTS_HEADER = [
+    "Model Configuration",
+    "Single LLM Accuracy",
+    "Ensemble Accuracy",
+    "Debate Accuracy",
+    "Running Time",
+]
+
+# Serializes results.csv appends when several configurations run concurrently
+_CSV_LOCK = threading.Lock()
+
+
+def append_results_csv(csv_path: Path, rows: List[List[str]]) -> None:
+    """Append result rows to the results CSV in a single buffered write.
+
+    Args:
+        csv_path: Path to the results CSV file
+        rows: Result rows to append, one per model configuration. The parent
+            directory of csv_path must already exist.
+    """
+    with _CSV_LOCK:
+        file_exists = csv_path.exists()
+
+        with open(csv_path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if not file_exists:
+                writer.writerow(RESULTS_HEADER)
+            writer.writerows(rows)
+
 
 def run(
     dataframe: pd.DataFrame,
@@ -27,8 +57,9 @@ def run(
     ],
     random_seed: int = 42,
     max_workers: Optional[int] = 4,
+    save_to_csv: bool = True,
     **debate_kwargs: Any,
-) -> None:
+) -> List[str]:
     """Execute debate evaluation with the given configuration.
 
     Args:
@@ -42,10 +73,13 @@ def run(
         model_configs: List of model configurations
         random_seed: Random seed for sampling
         max_workers: Maximum number of concurrent workers
+        save_to_csv: Whether to append the results row to results.csv. Callers
+            running several configurations can disable this and write all rows
+            at once with append_results_csv.
         **debate_kwargs: Additional arguments to pass to run_debate_fn
 
     Returns:
-        None: Results are saved to files and printed to console
+        List[str]: Results row for this configuration, also printed to console
     """
     start_time = time.time()
 
@@ -72,13 +106,15 @@ def run(
         **debate_kwargs,
     )
 
-    # Print execution summary
-    print(f"\nExecution Summary for {task_name}:")
-    print("-" * 50)
-    print(f"Total entries processed: {execution_report['total_entries']}")
-    print(f"Successfully processed: {execution_report['processed_count']}")
-    print(f"Failed entries: {len(execution_report['failed_entries'])}")
-    print(f"Success rate: {execution_report['success_rate']:.2f}%")
+    # Print execution summary in one call so concurrent runs don't interleave
+    print(
+        f"\nExecution Summary for {task_name}:\n"
+        f"{'-' * 50}\n"
+        f"Total entries processed: {execution_report['total_entries']}\n"
+        f"Successfully processed: {execution_report['processed_count']}\n"
+        f"Failed entries: {len(execution_report['failed_entries'])}\n"
+        f"Success rate: {execution_report['success_rate']:.2f}%"
+    )
 
     # Check if we have multiple model types
     model_types = {(config["provider"], config["name"]) for config in model_configs}
@@ -94,31 +130,19 @@ def run(
     display_time, csv_time = format_time(running_time)
     print(f"\nTotal running time: {display_time}")
 
+    results_row = [
+        model_config_str,
+        "N/A" if multiple_models else f"{results.single_llm_accuracy:.4f}",
+        f"{results.ensemble_accuracy:.4f}",
+        f"{results.debate_accuracy:.4f}",
+        csv_time,
+    ]
+
     # Save results to CSV
-    report_path.mkdir(parents=True, exist_ok=True)
-    csv_path = report_path / "results.csv"
-    file_exists = csv_path.exists()
-
-    with open(csv_path, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(
-                [
-                    "Model Configuration",
-                    "Single LLM Accuracy",
-                    "Ensemble Accuracy",
-                    "Debate Accuracy",
-                    "Running Time",
-                ]
-            )
-        writer.writerow(
-            [
-                model_configs_to_string(model_configs),
-                "N/A" if multiple_models else f"{results.single_llm_accuracy:.4f}",
-                f"{results.ensemble_accuracy:.4f}",
-                f"{results.debate_accuracy:.4f}",
-                csv_time,
-            ]
-        )
+    if save_to_csv:
+        report_path.mkdir(parents=True, exist_ok=True)
+        csv_path = report_path / "results.csv"
+        append_results_csv(csv_path, [results_row])
+        print(f"\nResults saved to {csv_path}")
 
-    print(f"\nResults saved to {csv_path}")
+    return results_row
@@ -1,5 +1,8 @@
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 import pandas as pd
 
@@ -8,26 +11,71 @@ from ...debate.debate import debate
 from ...llm.prompt_builder import PromptBuilder
 from ...utils.logging_config import setup_logging
 from ...utils.model_config import ModelConfig
-from ...utils.progress import progress
+from ...utils.progress import ProgressManager
+from .utils import (
+    ROUND_FILE_PREFIX,
+    ROUND_FILE_SUFFIX,
+    build_config_desc,
+    list_response_dirs,
+)
 
 logger = setup_logging(__name__)
 
 
+def has_debate_results(output_dir: str | Path) -> bool:
+    """Check whether a directory already holds any debate round file.
+
+    Uses a single directory scan that stops at the first match instead of
+    one stat call per possible round.
+
+    Args:
+        output_dir: Directory of a single debate entry
+
+    Returns:
+        bool: True if a debate_round_*.json file exists, False otherwise
+    """
+    try:
+        with os.scandir(output_dir) as it:
+            return any(
+                e.name.startswith(ROUND_FILE_PREFIX)
+                and e.name.endswith(ROUND_FILE_SUFFIX)
+                for e in it
+            )
+    except FileNotFoundError:
+        return False
+
+
+def get_prompt_fields(prompt_builder: PromptBuilder) -> Set[str]:
+    """Get the parameter names accepted by a builder's round-zero prompt.
+
+    Args:
+        prompt_builder: Configured PromptBuilder instance
+
+    Returns:
+        Set[str]: Parameter names of prompt_builder.round_zero_fn
+    """
+    return set(inspect.signature(prompt_builder.round_zero_fn).parameters)
+
+
 def run_debate_single_entry(
-    entry: pd.Series,
+    entry: Mapping[str, Any],
     prompt_builder: PromptBuilder,
     required_columns: List[str],
     max_rounds: int = 10,
-    base_dir: Path = Path("data"),
+    base_dir: str | Path = Path("data"),
     use_cot: bool = True,
     model_configs: Optional[List[ModelConfig]] = None,
     overwrite: bool = False,
     max_workers: Optional[int] = 4,
+    agents_ensemble: Optional[AgentsEnsemble] = None,
+    validate: bool = True,
+    existing_dirs: Optional[Set[str]] = None,
+    prompt_fields: Optional[Set[str]] = None,
 ) -> None:
     """Run a single debate entry with configurable prompt functions.
 
     Args:
-        entry: Pandas Series containing the debate entry data
+        entry: Mapping (dict or pandas Series) containing the debate entry data
         prompt_builder: Configured PromptBuilder instance
         required_columns: List of required column names in the entry
         max_rounds: Maximum number of debate rounds
@@ -36,56 +84,80 @@ def run_debate_single_entry(
         model_configs: Optional list of model configurations
         overwrite: Whether to overwrite existing debate results
         max_workers: Maximum number of concurrent workers
+        agents_ensemble: Optional ensemble shared with other entries. If None, a
+            new ensemble is built from model_configs and closed afterwards.
+        validate: Whether to check the entry type and required columns. Callers
+            that already validated the whole DataFrame can skip this.
+        existing_dirs: Optional names of the entry directories already under
+            base_dir. Entries missing from it are known to have no results, so
+            their directory isn't scanned. If None, every entry is scanned.
+        prompt_fields: Optional parameter names of prompt_builder's round-zero
+            function. If None, they are read from its signature.
 
     Raises:
         ValueError: If entry format is invalid
         RuntimeError: If debate execution fails
     """
     try:
-        if not isinstance(entry, pd.Series):
-            logger.error("Invalid entry type")
-            raise ValueError("Entry must be a pandas Series.")
-
-        # Validate required columns
-        missing_columns = [col for col in required_columns if col not in entry.index]
-        if missing_columns:
-            logger.error(f"Missing required columns: {missing_columns}")
-            raise ValueError(
-                f"Entry must contain columns: {', '.join(required_columns)}"
-            )
+        if validate:
+            if not isinstance(entry, (Mapping, pd.Series)):
+                logger.error("Invalid entry type")
+                raise ValueError("Entry must be a mapping or a pandas Series.")
+
+            # Validate required columns
+            missing_columns = [col for col in required_columns if col not in entry]
+            if missing_columns:
+                logger.error("Missing required columns: %s", missing_columns)
+                raise ValueError(
+                    f"Entry must contain columns: {', '.join(required_columns)}"
+                )
 
         id_ = str(entry.get("id", "unknown"))
-        logger.info(f"Starting debate for entry ID: {id_}")
+        logger.info("Starting debate for entry ID: %s", id_)
 
-        output_dir = base_dir / id_
-        logger.debug(f"Output directory set to: {output_dir}")
+        # Plain string paths avoid building Path objects for every entry
+        output_dir = os.path.join(base_dir, id_)
+        logger.debug("Output directory set to: %s", output_dir)
 
-        if output_dir.exists() and not overwrite:
-            debate_files = [
-                output_dir / f"debate_round_{i}.json" for i in range(max_rounds)
-            ]
-            if any(f.exists() for f in debate_files):
-                logger.info(f"Skipping entry {id_} - debate results exist")
-                return
+        if (
+            not overwrite
+            and (existing_dirs is None or id_ in existing_dirs)
+            and has_debate_results(output_dir)
+        ):
+            logger.info("Skipping entry %s - debate results exist", id_)
+            return
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
 
-        prompt_builder.prompt_params["use_cot"] = use_cot
-        agents_ensemble = AgentsEnsemble(
-            config_list=model_configs, max_workers=max_workers
+        # Fill the prompt parameters from this entry's columns
+        if prompt_fields is None:
+            prompt_fields = get_prompt_fields(prompt_builder)
+        entry_prompt_builder = prompt_builder.with_params(
+            **{col: entry[col] for col in required_columns if col in prompt_fields},
+            use_cot=use_cot,
         )
 
+        owns_ensemble = agents_ensemble is None
+        if owns_ensemble:
+            agents_ensemble = AgentsEnsemble(
+                config_list=model_configs, max_workers=max_workers
+            )
+
         logger.info("Starting debate execution")
-        debate(
-            max_rounds=max_rounds,
-            prompt_builder=prompt_builder,
-            agents_ensemble=agents_ensemble,
-            output_dir=output_dir,
-        )
+        try:
+            debate(
+                max_rounds=max_rounds,
+                prompt_builder=entry_prompt_builder,
+                agents_ensemble=agents_ensemble,
+                output_dir=output_dir,
+            )
+        finally:
+            if owns_ensemble:
+                agents_ensemble.close()
         logger.info("Debate completed successfully")
 
     except Exception as e:
-        logger.error(f"Debate execution failed: {str(e)}", exc_info=True)
+        logger.error("Debate execution failed: %s", e, exc_info=True)
         raise RuntimeError(f"Debate execution failed: {str(e)}") from e
 
 
@@ -99,6 +171,8 @@ def run_debate(
     model_configs: Optional[List[ModelConfig]] = None,
     overwrite: bool = False,
     max_workers: Optional[int] = 4,
+    max_concurrent_entries: int = 4,
+    show_progress: bool = True,
 ) -> Dict[str, Any]:
     """Run debates on a DataFrame with configurable prompt functions.
 
@@ -111,7 +185,10 @@ def run_debate(
         use_cot: Whether to use chain-of-thought prompting
         model_configs: Optional list of model configurations
         overwrite: Whether to overwrite existing debate results
-        max_workers: Maximum number of concurrent workers
+        max_workers: Maximum number of concurrent agent calls within one debate
+        max_concurrent_entries: Maximum number of entries debated concurrently
+        show_progress: Whether to draw a progress bar. Disable it when several
+            runs share the terminal, so their bars don't overwrite each other.
 
     Returns:
         Dict containing summary of execution including failed entries
@@ -129,44 +206,83 @@ def run_debate(
             logger.error("Invalid DataFrame type")
             raise ValueError("Dataframe must be a pandas DataFrame.")
 
-        missing_columns = [
-            col for col in required_columns if col not in dataframe.columns
-        ]
-        if missing_columns:
-            logger.error(f"Missing required columns: {missing_columns}")
+        # Rows share the DataFrame's columns, so this check covers every entry
+        columns = set(dataframe.columns)
+        if not columns.issuperset(required_columns):
+            missing_columns = [col for col in required_columns if col not in columns]
+            logger.error("Missing required columns: %s", missing_columns)
             raise ValueError(
                 f"DataFrame must contain columns: {', '.join(required_columns)}"
             )
 
-        from ..shared.utils import build_config_desc
-
         config_desc = build_config_desc(model_configs, use_cot, max_rounds)
-        with progress.main_bar(
-            total=len(dataframe), desc=f"Running debates [{config_desc}]", unit="debate"
-        ) as pbar:
-            for _, entry in dataframe.iterrows():
-                try:
-                    run_debate_single_entry(
-                        entry=entry,
-                        prompt_builder=prompt_builder,
-                        required_columns=required_columns,
-                        max_rounds=max_rounds,
-                        base_dir=base_dir,
-                        use_cot=use_cot,
-                        model_configs=model_configs,
-                        overwrite=overwrite,
-                        max_workers=max_workers,
-                    )
-                    processed_count += 1
-                    pbar.update(1)
-                except Exception as e:
-                    entry_id = entry.get("id", "unknown")
-                    logger.error(f"Failed to process entry {entry_id}: {str(e)}")
-                    failed_entries.append({"id": entry_id, "error": str(e)})
-                    continue
+        # Plain dicts avoid building a pandas Series for every row
+        entries = dataframe.to_dict("records")
+        entry_workers = max(1, min(len(entries), max_concurrent_entries))
+        # List base_dir once so new entries skip the per-entry results scan
+        existing_dirs = None if overwrite else list_response_dirs(base_dir)
+        # Inspect the prompt signature once instead of for every entry
+        prompt_fields = get_prompt_fields(prompt_builder)
+
+        # Agents are stateless, so one ensemble serves every entry. Its pool is
+        # sized so each concurrent debate still gets max_workers agent calls.
+        agents_ensemble = AgentsEnsemble(
+            config_list=model_configs,
+            max_workers=max_workers * entry_workers if max_workers else None,
+        )
+        with (
+            agents_ensemble,
+            # A manager per run, so concurrent runs don't share bar state
+            ProgressManager().main_bar(
+                total=len(dataframe),
+                desc=f"Running debates [{config_desc}]",
+                unit="debate",
+                # Throttle redraws when entries finish quickly (e.g. skipped)
+                mininterval=1.0,
+                miniters=max(1, len(entries) // 100),
+                disable=None if show_progress else True,
+            ) as pbar,
+            ThreadPoolExecutor(max_workers=entry_workers) as executor,
+        ):
+            futures = {
+                executor.submit(
+                    run_debate_single_entry,
+                    entry=entry,
+                    prompt_builder=prompt_builder,
+                    required_columns=required_columns,
+                    max_rounds=max_rounds,
+                    base_dir=base_dir,
+                    use_cot=use_cot,
+                    model_configs=model_configs,
+                    overwrite=overwrite,
+                    max_workers=max_workers,
+                    agents_ensemble=agents_ensemble,
+                    # Columns were already validated for the whole DataFrame
+                    validate=False,
+                    existing_dirs=existing_dirs,
+                    prompt_fields=prompt_fields,
+                ): entry.get("id", "unknown")
+                for entry in entries
+            }
+            try:
+                # Report progress as debates finish rather than in submission order
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        processed_count += 1
+                        pbar.update(1)
+                    except Exception as e:
+                        entry_id = futures[future]
+                        logger.error("Failed to process entry %s: %s", entry_id, e)
+                        failed_entries.append({"id": entry_id, "error": str(e)})
+                        continue
+            except BaseException:
+                # On Ctrl-C, drop the queued entries instead of debating them all
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
     except Exception as e:
-        logger.error(f"Global execution error: {str(e)}", exc_info=True)
+        logger.error("Global execution error: %s", e, exc_info=True)
         raise RuntimeError(f"Global execution error: {str(e)}") from e
 
     finally:
@@ -177,15 +293,15 @@ def run_debate(
         )
 
         logger.info("Debate execution completed")
-        logger.info(f"Total entries processed: {total_entries}")
-        logger.info(f"Successful: {processed_count}")
-        logger.info(f"Failed: {failed_count}")
-        logger.info(f"Success rate: {success_rate:.2f}%")
+        logger.info("Total entries processed: %d", total_entries)
+        logger.info("Successful: %d", processed_count)
+        logger.info("Failed: %d", failed_count)
+        logger.info("Success rate: %.2f%%", success_rate)
 
         if failed_entries:
             logger.warning("Failed entries:")
             for entry in failed_entries:
-                logger.warning(f"ID: {entry['id']}, Error: {entry['error']}")
+                logger.warning("ID: %s, Error: %s", entry["id"], entry["error"])
 
     return {
         "total_entries": total_entries,
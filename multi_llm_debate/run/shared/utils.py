@@ -1,15 +1,19 @@
 import argparse
-import glob
-import re
+import os
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from ...utils.logging_config import setup_logging
 from ...utils.model_config import ModelConfig
 
 logger = setup_logging(__name__)
 
+# Debate round files are named debate_round_<n>.json
+ROUND_FILE_PREFIX = "debate_round_"
+ROUND_FILE_SUFFIX = ".json"
+
 
 @dataclass
 class Args:
@@ -17,7 +21,8 @@ class Args:
 
     config: Optional[Path]
     sample_size: int
-    max_workers: int
+    max_workers: Optional[int]
+    max_concurrent_configs: Optional[int]
 
 
 class Parser:
@@ -45,8 +50,20 @@ class Parser:
         self.parser.add_argument(
             "--max-workers",
             type=int,
-            help="Maximum number of concurrent workers",
-            default=16,
+            help=(
+                "Maximum number of concurrent agent calls per debate. Defaults to "
+                "MLD_MAX_WORKERS, or a CPU-based value if it is not set"
+            ),
+            default=None,
+        )
+        self.parser.add_argument(
+            "--max-concurrent-configs",
+            type=int,
+            help=(
+                "Maximum number of model configurations run at once. Defaults "
+                "to MLD_MAX_CONCURRENT_CONFIGS, or 1 if it is not set"
+            ),
+            default=None,
         )
 
     def parse_args(self) -> Args:
@@ -58,6 +75,59 @@ class Parser:
         return Args(**vars(self.parser.parse_args()))
 
 
+def resolve_max_workers(max_workers: Optional[int] = None) -> int:
+    """Resolve the number of concurrent agent calls per debate.
+
+    LLM calls are I/O-bound, so the default scales with the CPU count rather
+    than matching it. Raise it for hosted endpoints; keep it low for a local
+    Ollama server, which can only serve a few requests at once.
+
+    Args:
+        max_workers: Explicit number of workers, used as is when given
+
+    Returns:
+        int: max_workers if given, else the MLD_MAX_WORKERS environment
+            variable, else min(32, 5 * CPU count)
+    """
+    if max_workers is not None:
+        return max_workers
+    return int(os.environ.get("MLD_MAX_WORKERS", 0)) or min(
+        32, (os.cpu_count() or 1) * 5
+    )
+
+
+def resolve_max_concurrent_configs(
+    max_concurrent_configs: Optional[int] = None,
+) -> int:
+    """Resolve the number of model configurations to run concurrently.
+
+    Args:
+        max_concurrent_configs: Explicit number of configurations, used as is
+            when given
+
+    Returns:
+        int: max_concurrent_configs if given, else the MLD_MAX_CONCURRENT_CONFIGS
+            environment variable, else 1
+
+    Raises:
+        ValueError: If the resolved value is not a positive integer
+    """
+    if max_concurrent_configs is None:
+        env_value = os.environ.get("MLD_MAX_CONCURRENT_CONFIGS") or "1"
+        try:
+            max_concurrent_configs = int(env_value)
+        except ValueError:
+            raise ValueError(
+                f"MLD_MAX_CONCURRENT_CONFIGS must be an integer, got {env_value!r}"
+            ) from None
+    if max_concurrent_configs < 1:
+        raise ValueError(
+            "max_concurrent_configs must be at least 1, "
+            f"got {max_concurrent_configs}"
+        )
+    return max_concurrent_configs
+
+
 def format_config_overview(model_configs_list: List[List[ModelConfig]]) -> str:
     """Format model configurations for display in progress bar.
 
@@ -68,8 +138,9 @@ def format_config_overview(model_configs_list: List[List[ModelConfig]]) -> str:
         str: Formatted string showing number of configs and total models
     """
     total_configs = len(model_configs_list)
+    # Sum over all configs in a single flat pass
     total_models = sum(
-        sum(config["quantity"] for config in configs) for configs in model_configs_list
+        config["quantity"] for configs in model_configs_list for config in configs
     )
     return f"Running {total_configs} configs ({total_models} total models)"
 
@@ -121,9 +192,8 @@ def format_time(seconds: float) -> Tuple[str, str]:
     Returns:
         tuple[str, str]: (human readable format, CSV format)
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    remaining_seconds = seconds % 60
+    minutes, remaining_seconds = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
 
     if hours > 0:
         display_time = f"{hours}h {minutes}m {remaining_seconds:.2f}s"
@@ -156,15 +226,15 @@ def model_configs_to_string(model_configs: List[Dict]) -> str:
         'llama2(3)+llama3(3)'
     """
     # Sort configs by model name and quantity
-    sorted_configs = sorted(model_configs, key=lambda x: (x["name"], x["quantity"]))
+    sorted_configs = sorted(model_configs, key=itemgetter("name", "quantity"))
 
     # Join with plus signs, remove spaces for filesystem safety
     return "+".join(
-        f"{config['name']}({config['quantity']})" for config in sorted_configs
+        [f"{config['name']}({config['quantity']})" for config in sorted_configs]
     )
 
 
-def get_latest_round_file(responses_dir: Path) -> Path:
+def get_latest_round_file(responses_dir: str | Path) -> Path:
     """Get the file path for the latest debate round.
 
     Args:
@@ -172,13 +242,41 @@ def get_latest_round_file(responses_dir: Path) -> Path:
 
     Returns:
         Path to the latest debate round file
+
+    Raises:
+        FileNotFoundError: If responses_dir does not exist
+        ValueError: If responses_dir contains no debate round files
     """
-    pattern = str(responses_dir / "debate_round_*.json")
-    files = glob.glob(pattern)
-    if not files:
+    responses_dir = Path(responses_dir)
+
+    # Track the highest round number in a single directory scan
+    latest_round = -1
+    with os.scandir(responses_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(ROUND_FILE_PREFIX) and name.endswith(ROUND_FILE_SUFFIX):
+                round_str = name[len(ROUND_FILE_PREFIX) : -len(ROUND_FILE_SUFFIX)]
+                if round_str.isdigit():
+                    latest_round = max(latest_round, int(round_str))
+
+    if latest_round < 0:
         raise ValueError(f"No debate round files found in {responses_dir}")
 
-    # Extract round numbers and find max
-    rounds = [int(re.search(r"debate_round_(\d+)", f).group(1)) for f in files]
-    latest_round = max(rounds)
-    return Path(responses_dir / f"debate_round_{latest_round}.json")
+    return responses_dir / f"{ROUND_FILE_PREFIX}{latest_round}{ROUND_FILE_SUFFIX}"
+
+
+def list_response_dirs(response_base_dir: str | Path) -> Set[str]:
+    """List the entry directories under a response directory in one scan.
+
+    Args:
+        response_base_dir: Directory containing one subdirectory per entry.
+
+    Returns:
+        Set[str]: Names of the entry directories, empty if the directory
+            doesn't exist.
+    """
+    try:
+        with os.scandir(response_base_dir) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
@@ -0,0 +1,10 @@
+#!/bin/bash
+
+# Run the evaluation using module path
+# Usage: bool_q.sh <config name>, e.g. bool_q.sh 3_llama2 for configs/3_llama2.json
+CONFIG_NAME=${1:?"Usage: $0 <config name>"}
+
+python -m multi_llm_debate.run.bool_q.main \
+    --config "./multi_llm_debate/configs/${CONFIG_NAME}.json" \
+    --sample-size 2000 \
+    --max-workers 4
@@ -1,14 +1,37 @@
+import copy
 import json
 from pathlib import Path
 from typing import List, Tuple
 
+# orjson is optional; both codecs read and write the config as UTF-8 bytes
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CONFIG_DIR = PROJECT_ROOT / "configs"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Parsed config.json and derived values, valid while the file's mtime matches
+_CACHE = {"mtime": None, "data": None, "models": None}
 
-def load_config():
-    if not CONFIG_FILE.exists():
+
+def _reset_cache() -> None:
+    _CACHE.update(mtime=None, data=None, models=None)
+
+
+def _read_config():
+    # Returns the cached dict itself, so it must not be modified
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _reset_cache()
         return {
             "api_key": "",
             "base_url": "https://api2.aigcbest.top/v1",
@@ -24,32 +47,44 @@ def load_config():
                 {"provider": "ollama", "name": "llama3.2-vision:90b", "quantity": 1},
             ],
         }
-    with open(CONFIG_FILE, "r") as f:
-        return json.load(f)
+    if _CACHE["mtime"] != mtime:
+        data = json_loads(CONFIG_FILE.read_bytes())
+        _CACHE.update(mtime=mtime, data=data, models=None)
+    return _CACHE["data"]
+
+
+def load_config():
+    # Deep copy so callers can modify the result without corrupting the cache
+    return copy.deepcopy(_read_config())
 
 
 def save_config(config):
     CONFIG_DIR.mkdir(exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f)
+    CONFIG_FILE.write_bytes(json_dumps(config))
+    _reset_cache()
 
 
 def get_api_key() -> str:
-    config = load_config()
+    config = _read_config()
     return config.get("api_key", "")
 
 
 def get_base_url() -> str:
-    config = load_config()
+    config = _read_config()
     return config.get("base_url")  # Remove redundant default value
 
 
 def get_models() -> List[Tuple[str, str, int]]:
-    config = load_config()
-    return [
+    config = _read_config()
+    if config is _CACHE["data"] and _CACHE["models"] is not None:
+        return list(_CACHE["models"])
+    models = [
         (model["provider"], model["name"], model["quantity"])
         for model in config.get("models", [])
     ]
+    if config is _CACHE["data"]:
+        _CACHE["models"] = models
+    return list(models)
 
 
 def save_api_key(key: str) -> None:
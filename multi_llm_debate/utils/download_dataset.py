@@ -1,17 +1,62 @@
+import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Tuple
 
 import pandas as pd
-from huggingface_hub import HfApi
-from modelscope import MsDataset
-from modelscope.utils.constant import DownloadMode
 
-from datasets import Dataset, load_dataset, load_from_disk
+# The dataset libraries are slow to import, so they are imported in the
+# functions that use them
+if TYPE_CHECKING:
+    from datasets import Dataset
+    from huggingface_hub import HfApi
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Results of successful version checks, keyed by dataset name and local path.
+# Cleared whenever a freshly downloaded copy is saved.
+_VERSION_CHECKS: Dict[Tuple[str, str], bool] = {}
+
+
+@lru_cache(maxsize=1)
+def _get_hf_api() -> "HfApi":
+    """
+    Return the Hugging Face Hub client shared by all version checks.
+
+    Returns:
+        HfApi: The shared Hub client.
+    """
+    from huggingface_hub import HfApi
+
+    return HfApi()
+
+
+def _read_download_checksums(dataset_path: str) -> Optional[dict]:
+    """
+    Read the download checksums recorded for a dataset saved to disk.
+
+    Only the small dataset_info.json is parsed, at the top level for a single
+    Dataset or in the first split directory for a DatasetDict. The dataset is
+    loaded with load_from_disk only if no such file exists.
+
+    Args:
+        dataset_path (str): Local path where dataset is saved.
+
+    Returns:
+        Optional[dict]: The download checksums, or None if none are recorded.
+    """
+    root = Path(dataset_path)
+    info_files = [root / "dataset_info.json", *sorted(root.glob("*/dataset_info.json"))]
+    for info_file in info_files:
+        if info_file.is_file():
+            return json.loads(info_file.read_bytes()).get("download_checksums")
+
+    from datasets import load_from_disk
+
+    return load_from_disk(dataset_path).info.download_checksums
+
 
 def _check_dataset_version(dataset_name: str, dataset_path: Path) -> bool:
     """
@@ -24,30 +69,33 @@ def _check_dataset_version(dataset_name: str, dataset_path: Path) -> bool:
     Returns:
         bool: True if local version is latest, False if update needed.
     """
+    # Normalize the path so equivalent str and Path arguments share a cache entry
+    key = (dataset_name, str(Path(dataset_path)))
+    if key in _VERSION_CHECKS:
+        return _VERSION_CHECKS[key]
+
     try:
-        api = HfApi()
         # Get latest commit hash from Hub
-        remote_info = api.dataset_info(dataset_name)
-        remote_sha = remote_info.sha
-
-        # Get local version info (stored in dataset_info.json)
-        try:
-            dataset = load_from_disk(str(dataset_path))
-            local_info = dataset.info.download_checksums
-            if not local_info or remote_sha not in str(local_info):
-                return False
-            return True
-        except Exception:
-            return False
-
+        remote_sha = _get_hf_api().dataset_info(dataset_name).sha
     except Exception as e:
+        # Not cached, so a transient error doesn't outlive this call
         logger.warning(f"Failed to check dataset version: {str(e)}")
         return True  # On error, assume local version is OK
 
+    # Get local version info (stored in dataset_info.json)
+    try:
+        local_info = _read_download_checksums(key[1])
+    except Exception:
+        return False
+
+    is_latest = bool(local_info) and remote_sha in str(local_info)
+    _VERSION_CHECKS[key] = is_latest
+    return is_latest
+
 
 def load_save_huggingface_dataset(
     dataset_name: str, dataset_path: Optional[Path] = None, force_download: bool = False
-) -> Optional[Dataset]:
+) -> Optional["Dataset"]:
     """
     Load and save a Hugging Face dataset to disk.
 
@@ -60,6 +108,8 @@ def load_save_huggingface_dataset(
     Returns:
         Optional[Dataset]: The loaded dataset if successful, None otherwise.
     """
+    from datasets import load_dataset, load_from_disk
+
     if dataset_path is None:
         try:
             logger.info(f"Loading dataset {dataset_name} without saving")
@@ -73,6 +123,7 @@ def load_save_huggingface_dataset(
                 logger.info(f"Force downloading dataset {dataset_name}")
                 dataset = load_dataset(dataset_name)
                 dataset.save_to_disk(str(dataset_path))
+                _VERSION_CHECKS.clear()
                 logger.info(f"Successfully saved dataset to {dataset_path}")
             else:
                 try:
@@ -87,11 +138,13 @@ def load_save_huggingface_dataset(
                         )
                         dataset = load_dataset(dataset_name)
                         dataset.save_to_disk(str(dataset_path))
+                        _VERSION_CHECKS.clear()
                         logger.info(f"Successfully saved dataset to {dataset_path}")
                 except FileNotFoundError:
                     logger.info(f"Dataset not found. Downloading {dataset_name}")
                     dataset = load_dataset(dataset_name)
                     dataset.save_to_disk(str(dataset_path))
+                    _VERSION_CHECKS.clear()
                     logger.info(
                         f"Successfully downloaded and saved dataset to {dataset_path}"
                     )
@@ -100,10 +153,11 @@ def load_save_huggingface_dataset(
             raise
 
     if dataset is not None:
-        try:
+        # A DatasetDict is a dict of splits. Test the keys rather than indexing
+        # into a plain Dataset, which would look up a column named "train".
+        if isinstance(dataset, dict) and "train" in dataset:
             return dataset["train"]
-        except KeyError:
-            return dataset
+        return dataset
     return None
 
 
@@ -143,7 +197,7 @@ def load_save_huggingface_dataset_df(
 
 def load_save_modelscope_dataset(
     dataset_name: str, dataset_path: Optional[Path] = None, force_download: bool = False
-) -> Optional[Dataset]:
+) -> Optional["Dataset"]:
     """
     Load and save a ModelScope dataset to disk.
 
@@ -156,6 +210,9 @@ def load_save_modelscope_dataset(
     Returns:
         Optional[Dataset]: The loaded dataset if successful, None otherwise.
     """
+    from modelscope import MsDataset
+    from modelscope.utils.constant import DownloadMode
+
     try:
         download_mode = (
             DownloadMode.FORCE_REDOWNLOAD
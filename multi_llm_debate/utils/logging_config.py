@@ -2,7 +2,10 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# Handlers shared by every module's logger, created on first use
+_SHARED_HANDLERS: Optional[Tuple[logging.Handler, logging.Handler]] = None
 
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -20,24 +23,22 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     logging.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
 
 
-def setup_logging(module_name: str, log_level: Optional[int] = None) -> logging.Logger:
-    """Set up logging configuration for a module.
-
-    Configures both file and console handlers with formatted output.
-    Creates a timestamped log file in the project's logs directory.
+def _get_shared_handlers() -> Tuple[logging.Handler, logging.Handler]:
+    """Get the file and console handlers shared by all loggers.
 
-    Args:
-        module_name: Name of the module requesting logging setup.
-            Used as the logger name for hierarchical logging.
-        log_level: Optional log level to set for the logger.
+    The handlers are created on the first call, so a process writes a single
+    timestamped log file however many modules set up logging.
 
     Returns:
-        logging.Logger: Configured logger instance with both file and console handlers.
-            Will reuse existing logger if one exists for the module name.
+        Tuple[logging.Handler, logging.Handler]: The file and console handlers.
 
     Raises:
         OSError: If unable to create logs directory or log file.
     """
+    global _SHARED_HANDLERS
+    if _SHARED_HANDLERS is not None:
+        return _SHARED_HANDLERS
+
     # Create logs directory if it doesn't exist
     log_dir = Path(__file__).parent.parent.parent / "logs"
     log_dir.mkdir(exist_ok=True)
@@ -59,6 +60,28 @@ def setup_logging(module_name: str, log_level: Optional[int] = None) -> logging.
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
+    _SHARED_HANDLERS = (file_handler, console_handler)
+    return _SHARED_HANDLERS
+
+
+def setup_logging(module_name: str, log_level: Optional[int] = None) -> logging.Logger:
+    """Set up logging configuration for a module.
+
+    Configures both file and console handlers with formatted output.
+    All modules share one timestamped log file in the project's logs directory.
+
+    Args:
+        module_name: Name of the module requesting logging setup.
+            Used as the logger name for hierarchical logging.
+        log_level: Optional log level to set for the logger.
+
+    Returns:
+        logging.Logger: Configured logger instance with both file and console handlers.
+            Will reuse existing logger if one exists for the module name.
+
+    Raises:
+        OSError: If unable to create logs directory or log file.
+    """
     # Get logger
     logger = logging.getLogger(module_name)
 
@@ -68,8 +91,8 @@ def setup_logging(module_name: str, log_level: Optional[int] = None) -> logging.
 
     # Add handlers if they haven't been added already
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        for handler in _get_shared_handlers():
+            logger.addHandler(handler)
 
     # Set up global exception handler
     sys.excepthook = handle_exception
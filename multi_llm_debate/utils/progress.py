@@ -3,6 +3,10 @@ from typing import Any, Iterator, Optional
 
 from tqdm import tqdm
 
+# Redraw at most twice a second, and skip drawing entirely when the output is
+# not a terminal (disable=None), e.g. in redirected or CI logs
+DEFAULT_BAR_KWARGS = {"mininterval": 0.5, "disable": None}
+
 
 class ProgressManager:
     """Manages nested progress bars to avoid conflicts and provide clear progress tracking."""
@@ -15,7 +19,12 @@ class ProgressManager:
     def main_bar(self, total: int, desc: str, **kwargs: Any) -> Iterator[tqdm]:
         """Creates the main progress bar."""
         try:
-            self.main_progress = tqdm(total=total, desc=desc, position=0, **kwargs)
+            self.main_progress = tqdm(
+                total=total,
+                desc=desc,
+                position=0,
+                **{**DEFAULT_BAR_KWARGS, **kwargs},
+            )
             yield self.main_progress
         finally:
             if self.main_progress:
@@ -27,7 +36,11 @@ class ProgressManager:
         """Creates a sub-progress bar below the main one."""
         try:
             self.sub_progress = tqdm(
-                total=total, desc=desc, position=1, leave=False, **kwargs
+                total=total,
+                desc=desc,
+                position=1,
+                leave=False,
+                **{**DEFAULT_BAR_KWARGS, **kwargs},
             )
             yield self.sub_progress
         finally:
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 
@@ -18,6 +20,20 @@ def pytest_configure(config):
         "integration: mark test as an integration test that makes real API calls",
     )
 
+    _limit_worker_threads()
+
+
+def _limit_worker_threads():
+    """Keep each pytest-xdist worker to one BLAS/torch thread.
+
+    Every worker loads its own encoder, so parallel workers would otherwise
+    oversubscribe the CPU. Runs before torch is imported, which reads these
+    variables at import time; serial runs and values already set are kept.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+            os.environ.setdefault(variable, "1")
+
 
 def pytest_collection_modifyitems(config, items):
     """Skip integration tests unless --run-integration is specified."""
@@ -28,3 +44,38 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "integration" in item.keywords:
                 item.add_marker(skip_integration)
+
+
+class CachedSentenceTransformer:
+    """SentenceTransformer wrapper that memoizes encode() by its input texts.
+
+    The pruning tests encode the same fixed sentences over and over, so each
+    distinct input is only run through the model once per session.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._cache = {}
+
+    def encode(self, sentences, **kwargs):
+        texts = sentences if isinstance(sentences, str) else tuple(sentences)
+        key = (texts, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = self.model.encode(sentences, **kwargs)
+        return self._cache[key]
+
+    def cache_clear(self):
+        """Forget all cached embeddings, e.g. to measure cold encoding."""
+        self._cache.clear()
+
+
+@pytest.fixture(scope="session")
+def sentence_transformer():
+    """Session-wide sentence transformer model, loaded once for all tests.
+
+    Encoding results are cached; call cache_clear() on the fixture to reset.
+    """
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+
+    model = sentence_transformers.SentenceTransformer("all-MiniLM-L6-v2")
+    return CachedSentenceTransformer(model)
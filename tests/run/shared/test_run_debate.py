@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock, patch
+
+from multi_llm_debate.llm.prompt_builder import PromptBuilder
+from multi_llm_debate.llm.prompts import (
+    build_bool_q_round_n_prompt,
+    build_bool_q_round_zero_prompt,
+)
+from multi_llm_debate.run.shared.run_debate import run_debate_single_entry
+
+
+def test_run_debate_single_entry_fills_prompt_from_entry(tmp_path):
+    """Test that the entry's columns reach the prompt and the base is untouched."""
+    base_builder = PromptBuilder(
+        round_zero_fn=build_bool_q_round_zero_prompt,
+        round_n_fn=build_bool_q_round_n_prompt,
+        prompt_params={},
+    )
+    entry = {
+        "id": 7,
+        "question": "Is the sky blue?",
+        "passage": "The sky appears blue due to Rayleigh scattering.",
+        "answer": True,
+    }
+
+    with patch("multi_llm_debate.run.shared.run_debate.debate") as mock_debate:
+        run_debate_single_entry(
+            entry=entry,
+            prompt_builder=base_builder,
+            required_columns=["question", "answer", "passage", "id"],
+            base_dir=tmp_path,
+            use_cot=False,
+            agents_ensemble=MagicMock(),
+        )
+
+    entry_builder = mock_debate.call_args.kwargs["prompt_builder"]
+    round_zero = entry_builder.build_round_zero()
+    assert "Question: Is the sky blue?" in round_zero
+    assert "Passage: The sky appears blue due to Rayleigh scattering." in round_zero
+    assert entry_builder.prompt_params["use_cot"] is False
+    # The answer column is not a prompt parameter and must not leak into it
+    assert "answer" not in entry_builder.prompt_params
+    assert base_builder.prompt_params == {}
@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -18,21 +20,31 @@ def mock_agents():
 
 @pytest.fixture
 def ensemble(mock_agents):
-    """Fixture providing an AgentsEnsemble instance."""
-    return AgentsEnsemble(agents=mock_agents)
+    """Fixture providing a concurrent AgentsEnsemble with one agent per mock."""
+    ensemble = AgentsEnsemble(
+        config_list=[
+            {"provider": agent.provider, "name": agent.model, "quantity": 1}
+            for agent in mock_agents
+        ],
+        job_delay=0,
+    )
+    yield ensemble
+    ensemble.close()
 
 
-def test_ensemble_initialization(mock_agents):
+def test_ensemble_initialization(ensemble, mock_agents):
     """Test AgentsEnsemble initialization with agents."""
-    ensemble = AgentsEnsemble(agents=mock_agents)
     assert len(ensemble.agents) == 3
     assert all(isinstance(agent, Agent) for agent in ensemble.agents)
+    assert [agent.model for agent in ensemble.agents] == [
+        agent.model for agent in mock_agents
+    ]
 
 
 def test_empty_ensemble_initialization():
     """Test AgentsEnsemble initialization with no agents."""
     with pytest.raises(ValueError):
-        AgentsEnsemble(agents=[])
+        AgentsEnsemble(config_list=[])
 
 
 @pytest.mark.parametrize(
@@ -58,10 +70,52 @@ def test_empty_ensemble_initialization():
 )
 def test_ensemble_responses(ensemble, responses, expected):
     """Test response handling with different response patterns."""
-    with patch.object(Agent, "respond") as mock_respond:
-        mock_respond.side_effect = responses
+
+    def respond(agent, prompt, json_mode=False):
+        # Later agents answer first, so completion order is reversed
+        time.sleep(0.01 * (len(responses) - agent.agent_id))
+        return responses[agent.agent_id]
+
+    with patch.object(Agent, "respond", autospec=True, side_effect=respond):
         result = ensemble.get_responses("What is your choice?")
-        assert len(result) == len(responses)
+        assert result == responses
+
+
+def test_ensemble_responses_run_concurrently():
+    """Test that agent calls overlap instead of running one after another."""
+    ensemble = AgentsEnsemble(
+        config_list=[{"provider": "ollama", "name": "model", "quantity": 4}],
+        max_workers=4,
+        job_delay=0,
+    )
+
+    # Every call waits for all four, so this only passes if they overlap
+    barrier = threading.Barrier(4, timeout=5)
+
+    def respond(agent, prompt, json_mode=False):
+        barrier.wait()
+        return {"agent_id": agent.agent_id}
+
+    try:
+        with patch.object(Agent, "respond", autospec=True, side_effect=respond):
+            result = ensemble.get_responses("What is your choice?")
+    finally:
+        ensemble.close()
+
+    assert [response["agent_id"] for response in result] == [0, 1, 2, 3]
+
+
+def test_ensemble_context_manager_closes_pool():
+    """Test that the worker pool is created on first use and closed on exit."""
+    with AgentsEnsemble(
+        config_list=[{"provider": "ollama", "name": "model", "quantity": 2}],
+        job_delay=0,
+    ) as ensemble:
+        assert ensemble._executor is None
+        with patch.object(Agent, "respond", return_value={"choice": "A"}):
+            ensemble.get_responses("What is your choice?")
+        assert ensemble._executor is not None
+    assert ensemble._executor is None
 
 
 @pytest.mark.integration
@@ -71,14 +125,6 @@ def test_ensemble_integration():
     Requires:
     - Multiple Ollama models to be available
     """
-    agents = [
-        Agent(agent_id=1, model="llama3.1:latest", provider="ollama"),
-        Agent(agent_id=2, model="llama3.1:latest", provider="ollama"),
-    ]
-    ensemble = AgentsEnsemble(auto_init=False)
-    for agent in agents:
-        ensemble.add_agent(agent)
-
     prompt = (
         "You are helping with a simple choice. "
         "Answer with a JSON object containing a 'choice' key "
@@ -86,7 +132,13 @@ def test_ensemble_integration():
         "Question: Is Python a programming language?"
     )
 
-    responses = ensemble.get_responses(prompt)
+    # Both agents are queried concurrently on the ensemble's thread pool
+    with AgentsEnsemble(
+        config_list=[{"provider": "ollama", "name": "llama3.1:latest", "quantity": 2}],
+        job_delay=0,
+    ) as ensemble:
+        responses = ensemble.get_responses(prompt)
+
     assert len(responses) == 2
     for response in responses:
         assert isinstance(response, dict), "Response should be a dictionary"
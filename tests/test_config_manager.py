@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from multi_llm_debate.utils import config_manager
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_manager, "CONFIG_FILE", tmp_path / "config.json")
+    config_manager._reset_cache()
+    yield tmp_path / "config.json"
+    config_manager._reset_cache()
+
+
+def test_load_config_is_cached(config_file, monkeypatch):
+    config_file.write_text(json.dumps({"api_key": "a", "models": []}))
+    loads = []
+    monkeypatch.setattr(
+        config_manager,
+        "json_loads",
+        lambda data: loads.append(data) or json.loads(data),
+    )
+
+    config_manager.load_config()
+    config_manager.load_config()
+
+    assert len(loads) == 1
+
+
+def test_load_config_copy_does_not_corrupt_cache(config_file):
+    config_file.write_text(
+        json.dumps(
+            {
+                "api_key": "a",
+                "models": [{"provider": "api", "name": "m", "quantity": 2}],
+            }
+        )
+    )
+    assert config_manager.get_models() == [("api", "m", 2)]
+
+    config = config_manager.load_config()
+    config["api_key"] = "b"
+    config["models"][0]["quantity"] = 5
+
+    assert config_manager.get_api_key() == "a"
+    assert config_manager.load_config()["models"][0]["quantity"] == 2
+    assert config_manager.get_models() == [("api", "m", 2)]
+
+
+def test_save_config_invalidates_cache(config_file):
+    config_manager.save_config(
+        {"api_key": "a", "models": [{"provider": "api", "name": "m", "quantity": 2}]}
+    )
+    assert config_manager.get_models() == [("api", "m", 2)]
+
+    config_manager.save_api_key("b")
+
+    assert config_manager.get_api_key() == "b"
+    assert config_manager.get_models() == [("api", "m", 2)]
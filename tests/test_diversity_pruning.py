@@ -1,13 +1,14 @@
+import numpy as np
 import pytest
-from sentence_transformers import SentenceTransformer
 
-from multi_llm_debate.interventions.diversity_pruning import diversity_pruning
-
-
-@pytest.fixture
-def sentence_transformer():
-    """Fixture providing a sentence transformer model."""
-    return SentenceTransformer("all-MiniLM-L6-v2")
+from multi_llm_debate.interventions.diversity_pruning import (
+    _select_diverse,
+    diversity_pruning,
+)
+from multi_llm_debate.interventions.utils import (
+    compute_sentence_embedding,
+    kullback_leibler_approximation_distance,
+)
 
 
 @pytest.fixture
@@ -81,3 +82,32 @@ def test_diversity_pruning_selected_greater_than_responses(sentence_transformer)
     )
     assert len(selected) == 2
     assert set(selected) == set(responses)
+
+
+def test_select_diverse_matches_pairwise_loop(sentence_transformer, sample_responses):
+    """Test the vectorized selection against a pairwise distance loop."""
+    embeddings = np.array(
+        [
+            compute_sentence_embedding(sentence_transformer, response)
+            for response in sample_responses
+        ],
+        dtype=np.float64,
+    )
+
+    for selected_amount in range(1, len(sample_responses) + 1):
+        expected = [0]
+        while len(expected) < selected_amount:
+            candidates = [i for i in range(len(embeddings)) if i not in expected]
+            expected.append(
+                max(
+                    candidates,
+                    key=lambda i: sum(
+                        kullback_leibler_approximation_distance(
+                            embeddings[i], embeddings[j]
+                        )
+                        for j in expected
+                    ),
+                )
+            )
+
+        assert _select_diverse(embeddings, selected_amount) == expected
@@ -7,6 +7,7 @@ from multi_llm_debate.llm.llm import (
     generate_api_messages,
     generate_with_api,
     generate_with_ollama,
+    get_api_client,
 )
 
 
@@ -34,6 +35,7 @@ def test_generate_with_ollama(mock_ollama):
 
 @patch("multi_llm_debate.llm.llm.OpenAI")
 def test_generate_with_api(mock_openai):
+    get_api_client.cache_clear()
     mock_client = MagicMock()
     mock_openai.return_value = mock_client
     mock_client.chat.completions.create.return_value.choices[0].message.content = (
@@ -46,6 +48,23 @@ def test_generate_with_api(mock_openai):
 
     assert response == "Test response"
     mock_client.chat.completions.create.assert_called_once()
+    get_api_client.cache_clear()
+
+
+@patch("multi_llm_debate.llm.llm.OpenAI")
+def test_generate_with_api_reuses_client(mock_openai):
+    get_api_client.cache_clear()
+
+    for _ in range(2):
+        generate_with_api(
+            model_name="test-model",
+            prompt="test prompt",
+            temperature=0.1,
+            max_tokens=100,
+        )
+
+    mock_openai.assert_called_once()
+    get_api_client.cache_clear()
 
 
 # Test high-level interface
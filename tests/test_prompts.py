@@ -1,70 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
 from multi_llm_debate.llm.prompt_builder import PromptBuilder
 from multi_llm_debate.llm.prompts import (
     BOOL_JSON_FORMAT,
     BOOL_JSON_FORMAT_COT,
     BOOL_NON_JSON_FORMAT,
     BOOL_NON_JSON_FORMAT_COT,
+    build_bool_q_answer_section,
     build_bool_q_round_n_prompt,
     build_bool_q_round_zero_prompt,
+    prepare_bool_q_prompt_params,
 )
 
-
-def test_build_bool_q_round_zero_prompt_with_cot() -> None:
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
-
-    prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=True, json_mode=True
-    )
-
-    assert "Question: Is the sky blue?" in prompt
-    assert "Passage: The sky appears blue due to Rayleigh scattering." in prompt
-    assert BOOL_JSON_FORMAT_COT in prompt
+FORMAT_CASES = pytest.mark.parametrize(
+    "use_cot, json_mode, answer_format, format_intro",
+    [
+        (True, True, BOOL_JSON_FORMAT_COT, "JSON format"),
+        (False, True, BOOL_JSON_FORMAT, "JSON format"),
+        (True, False, BOOL_NON_JSON_FORMAT_COT, "following format"),
+        (False, False, BOOL_NON_JSON_FORMAT, "following format"),
+    ],
+)
 
 
-def test_build_bool_q_round_zero_prompt_without_cot() -> None:
+@FORMAT_CASES
+def test_build_bool_q_round_zero_prompt(
+    use_cot: bool, json_mode: bool, answer_format: str, format_intro: str
+) -> None:
     question = "Is the sky blue?"
     passage = "The sky appears blue due to Rayleigh scattering."
 
     prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=False, json_mode=True
-    )
-
-    assert "Question: Is the sky blue?" in prompt
-    assert "Passage: The sky appears blue due to Rayleigh scattering." in prompt
-    assert BOOL_JSON_FORMAT in prompt
-
-
-def test_build_bool_q_round_n_prompt_with_cot() -> None:
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
-    responses = ["Response 1", "Response 2"]
-
-    prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=True, json_mode=True
+        question, passage, use_cot=use_cot, json_mode=json_mode
     )
 
-    assert "Model 1: Response 1" in prompt
-    assert "Model 2: Response 2" in prompt
     assert "Question: Is the sky blue?" in prompt
     assert "Passage: The sky appears blue due to Rayleigh scattering." in prompt
-    assert BOOL_JSON_FORMAT_COT in prompt
+    assert format_intro in prompt
+    assert answer_format in prompt
 
 
-def test_build_bool_q_round_n_prompt_without_cot() -> None:
+@FORMAT_CASES
+def test_build_bool_q_round_n_prompt(
+    use_cot: bool, json_mode: bool, answer_format: str, format_intro: str
+) -> None:
     question = "Is the sky blue?"
     passage = "The sky appears blue due to Rayleigh scattering."
     responses = ["Response 1", "Response 2"]
 
     prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=False, json_mode=True
+        question, passage, responses, use_cot=use_cot, json_mode=json_mode
     )
 
     assert "Model 1: Response 1" in prompt
     assert "Model 2: Response 2" in prompt
     assert "Question: Is the sky blue?" in prompt
     assert "Passage: The sky appears blue due to Rayleigh scattering." in prompt
-    assert BOOL_JSON_FORMAT in prompt
+    assert format_intro in prompt
+    assert answer_format in prompt
 
 
 def test_prompt_builder() -> None:
@@ -92,108 +87,96 @@ def test_prompt_builder() -> None:
     assert BOOL_JSON_FORMAT_COT in round_n
 
 
-def test_build_bool_q_round_zero_prompt_json_mode() -> None:
-    """Test round zero prompt with json_mode=True."""
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
-
-    prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=True, json_mode=True
-    )
-
-    assert "JSON format" in prompt
-    assert BOOL_JSON_FORMAT_COT in prompt
-
-    prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=False, json_mode=True
-    )
-
-    assert "JSON format" in prompt
-    assert BOOL_JSON_FORMAT in prompt
-
-
-def test_build_bool_q_round_zero_prompt_non_json_mode() -> None:
-    """Test round zero prompt with json_mode=False."""
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
-
-    prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=True, json_mode=False
-    )
-
-    assert "following format" in prompt
-    assert BOOL_NON_JSON_FORMAT_COT in prompt
+def test_prompt_builder_with_json_mode() -> None:
+    """Test PromptBuilder with json_mode parameter."""
+    params = {
+        "question": "Is the sky blue?",
+        "passage": "The sky appears blue due to Rayleigh scattering.",
+        "use_cot": True,
+        "json_mode": True,
+    }
 
-    prompt = build_bool_q_round_zero_prompt(
-        question, passage, use_cot=False, json_mode=False
+    builder = PromptBuilder(
+        round_zero_fn=build_bool_q_round_zero_prompt,
+        round_n_fn=build_bool_q_round_n_prompt,
+        prompt_params=params,
     )
 
-    assert "following format" in prompt
-    assert BOOL_NON_JSON_FORMAT in prompt
-
+    round_zero = builder.build_round_zero()
+    assert "JSON format" in round_zero
+    assert BOOL_JSON_FORMAT_COT in round_zero
 
-def test_build_bool_q_round_n_prompt_json_mode() -> None:
-    """Test round n prompt with json_mode=True."""
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
     responses = ["Response 1", "Response 2"]
+    round_n = builder.build_round_n(responses)
+    assert "JSON format" in round_n
+    assert BOOL_JSON_FORMAT_COT in round_n
 
-    prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=True, json_mode=True
-    )
-
-    assert "JSON format" in prompt
-    assert BOOL_JSON_FORMAT_COT in prompt
-
-    prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=False, json_mode=True
-    )
-
-    assert "JSON format" in prompt
-    assert BOOL_JSON_FORMAT in prompt
-
-
-def test_build_bool_q_round_n_prompt_non_json_mode() -> None:
-    """Test round n prompt with json_mode=False."""
-    question = "Is the sky blue?"
-    passage = "The sky appears blue due to Rayleigh scattering."
-    responses = ["Response 1", "Response 2"]
 
-    prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=True, json_mode=False
+def test_prompt_builder_with_params() -> None:
+    base = PromptBuilder(
+        round_zero_fn=build_bool_q_round_zero_prompt,
+        round_n_fn=build_bool_q_round_n_prompt,
+        prompt_params={"json_mode": True},
     )
 
-    assert "following format" in prompt
-    assert BOOL_NON_JSON_FORMAT_COT in prompt
-
-    prompt = build_bool_q_round_n_prompt(
-        question, passage, responses, use_cot=False, json_mode=False
+    builder = base.with_params(
+        question="Is the sky blue?",
+        passage="The sky appears blue due to Rayleigh scattering.",
+        use_cot=True,
     )
 
-    assert "following format" in prompt
-    assert BOOL_NON_JSON_FORMAT in prompt
+    round_zero = builder.build_round_zero()
+    assert "Question: Is the sky blue?" in round_zero
+    assert BOOL_JSON_FORMAT_COT in round_zero
+    assert base.prompt_params == {"json_mode": True}
 
 
-def test_prompt_builder_with_json_mode() -> None:
-    """Test PromptBuilder with json_mode parameter."""
+def test_prompt_builder_prepares_answer_section_once() -> None:
+    """Test that the answer section is built once per builder, not per round."""
     params = {
         "question": "Is the sky blue?",
         "passage": "The sky appears blue due to Rayleigh scattering.",
         "use_cot": True,
-        "json_mode": True,
     }
-
-    builder = PromptBuilder(
+    plain = PromptBuilder(
+        round_zero_fn=build_bool_q_round_zero_prompt,
+        round_n_fn=build_bool_q_round_n_prompt,
+        prompt_params=params,
+    )
+    prepared = PromptBuilder(
         round_zero_fn=build_bool_q_round_zero_prompt,
         round_n_fn=build_bool_q_round_n_prompt,
         prompt_params=params,
+        prepare_fn=prepare_bool_q_prompt_params,
     )
+    responses = ["Response 1", "Response 2"]
+    expected = [
+        plain.build_round_zero(),
+        plain.build_round_n(responses),
+        plain.build_round_n(responses),
+    ]
+
+    with patch(
+        "multi_llm_debate.llm.prompts.build_bool_q_answer_section",
+        wraps=build_bool_q_answer_section,
+    ) as mock_section:
+        prompts = [
+            prepared.build_round_zero(),
+            prepared.build_round_n(responses),
+            prepared.build_round_n(responses),
+        ]
+
+    assert prompts == expected
+    mock_section.assert_called_once()
+
+
+def test_build_bool_q_round_n_prompt_many_responses() -> None:
+    """Test round n prompt with a large ensemble keeps every response in order."""
+    responses = [f"Response {i}" for i in range(1, 1001)]
 
-    round_zero = builder.build_round_zero()
-    assert "JSON format" in round_zero
-    assert BOOL_JSON_FORMAT_COT in round_zero
+    prompt = build_bool_q_round_n_prompt(
+        "Is the sky blue?", "The sky is blue.", responses, use_cot=False
+    )
 
-    responses = ["Response 1", "Response 2"]
-    round_n = builder.build_round_n(responses)
-    assert "JSON format" in round_n
-    assert BOOL_JSON_FORMAT_COT in round_n
+    model_lines = [line for line in prompt.splitlines() if line.startswith("Model ")]
+    assert model_lines == [f"Model {i}: Response {i}" for i in range(1, 1001)]